@@ -13,7 +13,7 @@ For SEMANTIC memory (vector search), see memory.py
 
 import sqlite3
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 import json
 import os
 
@@ -239,6 +239,55 @@ class DatabaseManager:
         
         return success
     
+    # Appends to notes and fills a missing deadline in one statement, so
+    # concurrent writers can't overwrite each other's notes. ?1 is the note
+    # suffix (NULL leaves notes alone), ?2 the deadline, ?3 updated_at, ?4 the id.
+    _APPEND_NOTES_SQL = """
+        UPDATE applications
+        SET notes = CASE WHEN ?1 IS NULL THEN notes ELSE COALESCE(notes, '') || ?1 END,
+            deadline = COALESCE(NULLIF(deadline, ''), ?2),
+            updated_at = ?3
+        WHERE id = ?4
+    """
+    
+    def append_notes_and_set_deadline(
+        self,
+        app_id: int,
+        note_suffix: Optional[str],
+        deadline: Optional[str] = None
+    ) -> bool:
+        """
+        Append note_suffix to an application's notes and set its deadline
+        if it has none, without reading the row first.
+        Returns True if successful, False if not found.
+        """
+        return self.append_notes_and_set_deadline_bulk([(app_id, note_suffix, deadline)]) > 0
+    
+    def append_notes_and_set_deadline_bulk(
+        self,
+        rows: List[Tuple[int, Optional[str], Optional[str]]]
+    ) -> int:
+        """
+        Apply (app_id, note_suffix, deadline) appends in a single transaction.
+        Returns the number of applications updated.
+        """
+        if not rows:
+            return 0
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        now = datetime.now().isoformat()
+        cursor.executemany(self._APPEND_NOTES_SQL, [
+            (note_suffix, deadline, now, app_id) for app_id, note_suffix, deadline in rows
+        ])
+        
+        updated = cursor.rowcount
+        conn.commit()
+        conn.close()
+        
+        return updated
+    
     def delete_application(self, app_id: int) -> bool:
         """Delete an application by ID"""
         conn = self.get_connection()
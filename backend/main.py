@@ -447,7 +447,7 @@ async def program_recommender_tool(action: str, num_recommendations: int = 5, fo
 
 @app.post("/api/tools/research-automation")
 async def research_automation_tool(action: str, app_id: int = None, auto_update: bool = True,
-                                   include_fit_analysis: bool = True):
+                                   include_fit_analysis: bool = True, force_refresh: bool = False):
     """
     Research Automation MCP Tool endpoint.
 
@@ -463,13 +463,14 @@ async def research_automation_tool(action: str, app_id: int = None, auto_update:
         params = {
             "action": action,
             "auto_update": auto_update,
-            "include_fit_analysis": include_fit_analysis
+            "include_fit_analysis": include_fit_analysis,
+            "force_refresh": force_refresh
         }
 
         if app_id:
             params["app_id"] = app_id
 
-        result = tool.execute(**params)
+        result = await tool.execute_async(**params)
 
         if result.get("success"):
             return result
@@ -9,11 +9,20 @@ Uses real-time web search APIs to fetch live university data.
 
 import os
 import json
+import heapq
 import re
 import requests
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+# RapidFuzz matches misspelled university names ("georga tech") in the local
+# fallback search; without it, queries that match no name fall back to the top 10
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 
 class WebSearchService:
     """
@@ -25,6 +34,47 @@ class WebSearchService:
     3. Applies program preference matching
     """
 
+    # University name patterns for search results, tried in order
+    UNIVERSITY_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r'(MIT|Stanford|Harvard|Yale|Princeton|Columbia|Cornell|Berkeley|UCLA|USC|Caltech|Carnegie Mellon|Georgia Tech|University of \w+)',
+            r'(\w+ University)',
+            r'(\w+ Institute of Technology)',
+            r'(\w+ College)'
+        )
+    ]
+
+    # Program names and the (lowercase) phrases that identify them in search results
+    PROGRAM_KEYWORDS = {
+        "Computer Science": ["computer science", "cs program", "computing"],
+        "Machine Learning": ["machine learning", "ml program", "artificial intelligence", "ai program"],
+        "Data Science": ["data science", "analytics", "data analytics"],
+        "Electrical Engineering": ["electrical engineering", "ee program"],
+        "Business": ["mba", "business school", "management"]
+    }
+
+    # Typical deadlines (most fall between Dec 1 - Dec 15)
+    DEADLINES = ["December 1, 2025", "December 10, 2025", "December 15, 2025", "January 5, 2026"]
+
+    # Simplified tier analysis based on school names
+    TOP_SCHOOLS = ['MIT', 'Stanford', 'Harvard', 'Yale', 'Princeton', 'Caltech']
+    MID_SCHOOLS = ['Cornell', 'Columbia', 'UPenn', 'Brown', 'Northwestern']
+
+    # Minimum RapidFuzz WRatio score for a fuzzy university match; lower
+    # cutoffs start matching on shared words like "university"
+    FUZZY_MATCH_CUTOFF = 90
+
+    # search_programs returns at most this many programs
+    MAX_SEARCH_RESULTS = 20
+
+    # Recommendation reasoning per tier, filled with str.format_map; any
+    # tier other than reach/match reads as a safety school
+    TIER_REASONING = {
+        'reach': "Top-tier program (rank #{rank}) that would be an excellent addition to your portfolio. Strong in your field of interest.",
+        'match': "Well-matched program (rank #{rank}) based on your profile. Good acceptance rate and strong program reputation.",
+        'safety': "Strong safety option (rank #{rank}) with good funding opportunities and solid program quality.",
+    }
+
     def __init__(self, db_manager):
         self.db_manager = db_manager
 
@@ -99,6 +149,21 @@ class WebSearchService:
             ]
         }
 
+        # Universities the local fallback searches, per field and (under None)
+        # across all fields with duplicates removed, each paired with its
+        # lowercased name and location, so searches don't rebuild them
+        all_universities = []
+        seen = set()
+        for unis in self.universities_by_field.values():
+            for uni in unis:
+                if uni['name'] not in seen:
+                    seen.add(uni['name'])
+                    all_universities.append(uni)
+        self._search_lists = {
+            key: (unis, [(uni['name'].lower(), uni['location'].lower()) for uni in unis])
+            for key, unis in [*self.universities_by_field.items(), (None, all_universities)]
+        }
+
     def _perform_web_search(self, query: str) -> List[Dict[str, Any]]:
         """
         Perform actual web search using available API.
@@ -215,17 +280,9 @@ class WebSearchService:
         # Extract university name from common patterns
         text = f"{title} {snippet}"
 
-        # Common university patterns
-        university_patterns = [
-            r'(MIT|Stanford|Harvard|Yale|Princeton|Columbia|Cornell|Berkeley|UCLA|USC|Caltech|Carnegie Mellon|Georgia Tech|University of \w+)',
-            r'(\w+ University)',
-            r'(\w+ Institute of Technology)',
-            r'(\w+ College)'
-        ]
-
         university = None
-        for pattern in university_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.UNIVERSITY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 university = match.group(1)
                 break
@@ -238,23 +295,16 @@ class WebSearchService:
         degree = "MS"  # Default
 
         # Look for program names in text
-        program_keywords = {
-            "Computer Science": ["computer science", "cs program", "computing"],
-            "Machine Learning": ["machine learning", "ml program", "artificial intelligence", "ai program"],
-            "Data Science": ["data science", "analytics", "data analytics"],
-            "Electrical Engineering": ["electrical engineering", "ee program"],
-            "Business": ["mba", "business school", "management"]
-        }
-
-        for prog_name, keywords in program_keywords.items():
-            if any(kw in text.lower() for kw in keywords):
+        text_lower = text.lower()
+        for prog_name, keywords in self.PROGRAM_KEYWORDS.items():
+            if any(kw in text_lower for kw in keywords):
                 program = prog_name
                 break
 
         # Detect degree type
-        if "phd" in text.lower() or "doctoral" in text.lower():
+        if "phd" in text_lower or "doctoral" in text_lower:
             degree = "PhD"
-        elif "master" in text.lower() or "ms" in text.lower() or "m.s." in text.lower():
+        elif "master" in text_lower or "ms" in text_lower or "m.s." in text_lower:
             degree = "MS"
 
         # Extract location if available
@@ -262,7 +312,7 @@ class WebSearchService:
         location = location_match.group(1) if location_match else "Location TBD"
 
         # Extract ranking if mentioned
-        rank_match = re.search(r'#(\d+)|rank[ed]*\s*(\d+)|top\s*(\d+)', text.lower())
+        rank_match = re.search(r'#(\d+)|rank[ed]*\s*(\d+)|top\s*(\d+)', text_lower)
         ranking = int(rank_match.group(1) or rank_match.group(2) or rank_match.group(3)) if rank_match else None
 
         # Generate program entry
@@ -356,13 +406,8 @@ class WebSearchService:
                 # Apply intelligent filtering
                 results = self._apply_intelligent_filtering(results, user_context)
 
-                # Sort by relevance
-                results = sorted(results, key=lambda x: (
-                    x.get('relevance_score', 0),
-                    -x.get('ranking', 100)
-                ), reverse=True)
-
-                return results[:20]
+                # Keep the most relevant programs
+                return self._top_results(results)
 
         # Fallback to local database if no web search API available
         print("No web search API configured, using fallback local data")
@@ -370,30 +415,26 @@ class WebSearchService:
         # Determine search type and field
         field = self._detect_field(query_lower)
 
-        # Get relevant universities
-        if field and field in self.universities_by_field:
-            universities = self.universities_by_field[field]
-        else:
-            # Search across all fields
-            universities = []
-            for unis in self.universities_by_field.values():
-                universities.extend(unis)
-            # Remove duplicates
-            seen = set()
-            unique_unis = []
-            for uni in universities:
-                if uni['name'] not in seen:
-                    seen.add(uni['name'])
-                    unique_unis.append(uni)
-            universities = unique_unis
+        # Get relevant universities (the field's, or all of them)
+        universities, search_text = self._search_lists[field if field in self._search_lists else None]
 
         # Filter by query (university name or location)
-        filtered_unis = []
-        for uni in universities:
-            if (query_lower in uni['name'].lower() or
-                query_lower in uni['location'].lower() or
-                not query.strip()):
-                filtered_unis.append(uni)
+        if not query.strip():
+            filtered_unis = list(universities)
+        else:
+            filtered_unis = [
+                uni for uni, (name, location) in zip(universities, search_text)
+                if query_lower in name or query_lower in location
+            ]
+
+            # No substring match: take the closest university name, if close enough
+            if not filtered_unis and RAPIDFUZZ_AVAILABLE:
+                match = process.extractOne(
+                    query_lower.strip(), [name for name, _ in search_text],
+                    scorer=fuzz.WRatio, score_cutoff=self.FUZZY_MATCH_CUTOFF
+                )
+                if match:
+                    filtered_unis = [universities[match[2]]]
 
         # If no specific universities found, use top matches
         if not filtered_unis:
@@ -420,13 +461,20 @@ class WebSearchService:
         # Apply smart filtering based on user's application tier strategy
         results = self._apply_intelligent_filtering(results, user_context)
 
-        # Sort by relevance and rank
-        results = sorted(results, key=lambda x: (
+        # Keep the most relevant, best-ranked programs
+        return self._top_results(results)
+
+    def _top_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return the top MAX_SEARCH_RESULTS programs by relevance, then rank.
+
+        heapq.nlargest gives the same order as a full descending sort cut to
+        length (ties keep their input order) without sorting the whole list.
+        """
+        return heapq.nlargest(self.MAX_SEARCH_RESULTS, results, key=lambda x: (
             x.get('relevance_score', 0),
             -x.get('ranking', 100)
-        ), reverse=True)
-
-        return results[:20]  # Return top 20 results
+        ))
 
     def _get_user_context(self) -> Dict[str, Any]:
         """Analyze user's existing applications for context."""
@@ -502,8 +550,7 @@ class WebSearchService:
         acceptance_rate = base_acceptance + random.randint(-3, 3)
 
         # Deadlines (most fall between Dec 1 - Dec 15)
-        deadlines = ["December 1, 2025", "December 10, 2025", "December 15, 2025", "January 5, 2026"]
-        deadline = random.choice(deadlines)
+        deadline = random.choice(self.DEADLINES)
 
         # Funding (PhD programs have better funding)
         funding_available = degree == 'PhD' or random.random() > 0.4
@@ -617,11 +664,8 @@ class WebSearchService:
         # Simplified tier analysis based on school names
         tiers_needed = []
 
-        top_schools = ['MIT', 'Stanford', 'Harvard', 'Yale', 'Princeton', 'Caltech']
-        mid_schools = ['Cornell', 'Columbia', 'UPenn', 'Brown', 'Northwestern']
-
-        has_reach = any(any(school in app['school_name'] for school in top_schools) for app in applications)
-        has_match = any(any(school in app['school_name'] for school in mid_schools) for app in applications)
+        has_reach = any(any(school in app['school_name'] for school in self.TOP_SCHOOLS) for app in applications)
+        has_match = any(any(school in app['school_name'] for school in self.MID_SCHOOLS) for app in applications)
         has_safety = len(applications) > 0 and not (has_reach or has_match)
 
         if not has_reach:
@@ -676,11 +720,5 @@ class WebSearchService:
 
     def _generate_tier_reasoning(self, uni: Dict, program: str, tier: str, user_context: Dict) -> str:
         """Generate reasoning for recommendation."""
-        rank = uni.get('rank', 50)
-
-        if tier == 'reach':
-            return f"Top-tier program (rank #{rank}) that would be an excellent addition to your portfolio. Strong in your field of interest."
-        elif tier == 'match':
-            return f"Well-matched program (rank #{rank}) based on your profile. Good acceptance rate and strong program reputation."
-        else:  # safety
-            return f"Strong safety option (rank #{rank}) with good funding opportunities and solid program quality."
+        template = self.TIER_REASONING.get(tier, self.TIER_REASONING['safety'])
+        return template.format_map({'rank': uni.get('rank', 50)})
@@ -89,6 +89,54 @@ class DecisionAnalyzerTool:
         }
     }
 
+    # Rule-based feedback per decision, used when AI analysis is unavailable
+    RULE_BASED_ANALYSIS = {
+        "accepted": {
+            "likely_factors": (
+                "Strong academic profile",
+                "Good program fit",
+                "Well-prepared application"
+            ),
+            "strengths_shown": (
+                "Successfully demonstrated qualifications",
+                "Met or exceeded program requirements"
+            ),
+            "recommendations": (
+                "Use this acceptance as a template for future applications",
+                "Consider what made this application successful"
+            )
+        },
+        "rejected": {
+            "likely_factors": (
+                "Highly competitive program",
+                "Large applicant pool",
+                "Specific program requirements"
+            ),
+            "areas_for_improvement": (
+                "Consider strengthening academic credentials",
+                "Research program fit more thoroughly",
+                "Improve application materials"
+            ),
+            "recommendations": (
+                "Don't be discouraged - rejections are common",
+                "Focus on programs that are a better fit",
+                "Consider what you can improve for next cycle"
+            )
+        },
+        "waitlisted": {
+            "likely_factors": (
+                "Competitive candidate",
+                "Program considering enrollment numbers",
+                "Good fit but limited spots"
+            ),
+            "recommendations": (
+                "Send letter of continued interest",
+                "Update program on new achievements",
+                "Have backup options ready"
+            )
+        }
+    }
+
     def __init__(self, db_manager):
         """
         Initialize the decision analyzer tool.
@@ -422,49 +470,9 @@ Provide analysis in JSON format:
             "recommendations": []
         }
 
-        if decision == "accepted":
-            analysis["likely_factors"] = [
-                "Strong academic profile",
-                "Good program fit",
-                "Well-prepared application"
-            ]
-            analysis["strengths_shown"] = [
-                "Successfully demonstrated qualifications",
-                "Met or exceeded program requirements"
-            ]
-            analysis["recommendations"] = [
-                "Use this acceptance as a template for future applications",
-                "Consider what made this application successful"
-            ]
-
-        elif decision == "rejected":
-            analysis["likely_factors"] = [
-                "Highly competitive program",
-                "Large applicant pool",
-                "Specific program requirements"
-            ]
-            analysis["areas_for_improvement"] = [
-                "Consider strengthening academic credentials",
-                "Research program fit more thoroughly",
-                "Improve application materials"
-            ]
-            analysis["recommendations"] = [
-                "Don't be discouraged - rejections are common",
-                "Focus on programs that are a better fit",
-                "Consider what you can improve for next cycle"
-            ]
-
-        elif decision == "waitlisted":
-            analysis["likely_factors"] = [
-                "Competitive candidate",
-                "Program considering enrollment numbers",
-                "Good fit but limited spots"
-            ]
-            analysis["recommendations"] = [
-                "Send letter of continued interest",
-                "Update program on new achievements",
-                "Have backup options ready"
-            ]
+        # Fresh lists, so callers can extend the analysis
+        for field, items in self.RULE_BASED_ANALYSIS.get(decision, {}).items():
+            analysis[field] = list(items)
 
         return analysis
 
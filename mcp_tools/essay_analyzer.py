@@ -23,9 +23,312 @@ Tool Schema:
 }
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple
+from dataclasses import dataclass
+import copy
+import hashlib
+import os
 import re
-from collections import Counter
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# NumPy speeds up the per-sentence statistics on long essays.
+# If not available, we fall back to plain Python arithmetic.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Numba compiles the single-pass byte scan below to native code.
+# If not available, the scan is done with str.split/re instead.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# pyahocorasick finds every known phrase in one pass over the essay.
+# If not available, each phrase is searched for with a substring test.
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Hyperscan compiles every known phrase into one SIMD-accelerated matcher.
+# When available it is used instead of pyahocorasick.
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Below this many sentences the NumPy conversion costs more than it saves
+NUMPY_MIN_SENTENCES = 200
+
+# Sentences longer than this many words count as "long"
+LONG_SENTENCE_WORDS = 30
+
+# Paragraph separator: a blank line, even if it contains stray whitespace.
+# Anchored on the first newline so a match can only start at a '\n'; a leading
+# '\s*' let every position in a long whitespace run start a fresh scan, which
+# made splitting quadratic. Whitespace left before the '\n' does not change
+# a paragraph's word count.
+_PARA_RE = re.compile(r'\n\s*\n\s*')
+
+# Sentence bodies: runs of text between '.', '!' and '?'
+_SENT_FIND = re.compile(r'[^.!?]+')
+
+# Numbers, as evidence of specific quantitative detail
+_NUMBER_RE = re.compile(r'\d+')
+
+# Substrings counted (not just detected) in the lowercased essay bytes
+PASSIVE_INDICATORS = (b"was", b"were", b"been", b"being", b"is being", b"are being",
+                      b"has been", b"have been", b"had been")
+FIRST_PERSON = (b" i ", b"my ")
+
+
+class EssayScan(NamedTuple):
+    """Word, sentence and paragraph counts gathered in one pass over the essay"""
+    word_count: int
+    sentence_count: int
+    sentence_word_total: int
+    long_sentences: int
+    paragraph_count: int
+    first_paragraph_words: int
+    last_paragraph_words: int
+    passive_count: int
+    first_person_count: int
+
+
+def _sentence_length_stats(sentence_lengths: List[int], long_threshold: int) -> Tuple[int, int]:
+    """Return (total length, number of lengths above long_threshold)"""
+    if NUMPY_AVAILABLE and len(sentence_lengths) >= NUMPY_MIN_SENTENCES:
+        arr = np.fromiter(sentence_lengths, dtype=np.int32, count=len(sentence_lengths))
+        return int(arr.sum()), int((arr > long_threshold).sum())
+    return sum(sentence_lengths), sum(1 for l in sentence_lengths if l > long_threshold)
+
+
+def _scan_text(essay: str, essay_bytes: bytes) -> EssayScan:
+    """Compute an EssayScan with str.split/re/bytes.count (used when Numba is unavailable)"""
+    paragraphs = [p for p in _PARA_RE.split(essay.strip()) if p]
+    # findall yields only the text between terminators, so there is no empty
+    # trailing piece to filter; whitespace-only pieces have zero words
+    sentence_lengths = [n for n in (len(s.split()) for s in _SENT_FIND.findall(essay)) if n]
+    sentence_word_total, long_sentences = _sentence_length_stats(sentence_lengths, LONG_SENTENCE_WORDS)
+    
+    return EssayScan(
+        word_count=len(essay.split()),
+        sentence_count=len(sentence_lengths),
+        sentence_word_total=sentence_word_total,
+        long_sentences=long_sentences,
+        paragraph_count=len(paragraphs),
+        first_paragraph_words=len(paragraphs[0].split()) if paragraphs else 0,
+        last_paragraph_words=len(paragraphs[-1].split()) if paragraphs else 0,
+        passive_count=sum(essay_bytes.count(p) for p in PASSIVE_INDICATORS),
+        first_person_count=sum(essay_bytes.count(p) for p in FIRST_PERSON)
+    )
+
+
+def _pattern_table(groups: Tuple[Tuple[bytes, ...], ...]):
+    """
+    Pack byte patterns into the arrays _scan_bytes expects: a zero-padded
+    (n, max_len) uint8 matrix, each pattern's length and group index, and
+    for every byte value the [lo, hi) range of patterns ending in that byte.
+    """
+    flat = sorted(((g, pattern) for g, patterns in enumerate(groups) for pattern in patterns),
+                  key=lambda item: item[1][-1])
+    table = np.zeros((len(flat), max(len(p) for _, p in flat)), dtype=np.uint8)
+    lengths = np.empty(len(flat), dtype=np.int64)
+    group_ids = np.empty(len(flat), dtype=np.int64)
+    ending_lo = np.zeros(256, dtype=np.int64)
+    ending_hi = np.zeros(256, dtype=np.int64)
+    for k, (g, pattern) in enumerate(flat):
+        table[k, :len(pattern)] = np.frombuffer(pattern, dtype=np.uint8)
+        lengths[k] = len(pattern)
+        group_ids[k] = g
+        if ending_hi[pattern[-1]] == 0:
+            ending_lo[pattern[-1]] = k
+        ending_hi[pattern[-1]] = k + 1
+    return table, lengths, group_ids, ending_lo, ending_hi
+
+
+def _scan_bytes(buf, patterns, pattern_lengths, pattern_groups, ending_lo, ending_hi):
+    """
+    Byte-level equivalent of _scan_text for ASCII essays, JIT-compiled by Numba.
+    
+    Words are runs of non-whitespace (as str.split), sentences are runs of
+    words between '.', '!' and '?' (as _SENT_FIND), and paragraphs
+    are separated by whitespace containing two or more newlines (as _PARA_RE).
+    Occurrences of each pattern (see _pattern_table) are counted without
+    overlaps, as bytes.count does, and summed per group.
+    """
+    words = 0
+    sentences = 0
+    sentence_word_total = 0
+    long_sentences = 0
+    paragraphs = 0
+    first_paragraph_words = 0
+    last_paragraph_words = 0
+    
+    in_word = False
+    in_sentence_word = False
+    sentence_words = 0
+    paragraph_words = 0
+    gap_newlines = 0
+    
+    group_counts = np.zeros(2, dtype=np.int64)
+    # Earliest start of the next countable match for each pattern
+    next_start = np.zeros(patterns.shape[0], dtype=np.int64)
+    
+    for i in range(buf.shape[0]):
+        c = buf[i]
+        
+        # Patterns that end at this byte
+        for k in range(ending_lo[c], ending_hi[c]):
+            start = i + 1 - pattern_lengths[k]
+            if start >= next_start[k]:
+                matched = True
+                for j in range(pattern_lengths[k] - 1):
+                    if buf[start + j] != patterns[k, j]:
+                        matched = False
+                        break
+                if matched:
+                    group_counts[pattern_groups[k]] += 1
+                    next_start[k] = i + 1
+        
+        # Whitespace as understood by str.split() for ASCII text
+        if c == 32 or (9 <= c <= 13) or (28 <= c <= 31):
+            in_word = False
+            in_sentence_word = False
+            if c == 10:
+                gap_newlines += 1
+            continue
+        
+        # A blank line before this character closes the current paragraph
+        if gap_newlines >= 2 and paragraph_words > 0:
+            paragraphs += 1
+            if paragraphs == 1:
+                first_paragraph_words = paragraph_words
+            last_paragraph_words = paragraph_words
+            paragraph_words = 0
+        gap_newlines = 0
+        
+        if not in_word:
+            in_word = True
+            words += 1
+            paragraph_words += 1
+        
+        if c == 46 or c == 33 or c == 63:  # '.', '!', '?'
+            in_sentence_word = False
+            if sentence_words > 0:
+                sentences += 1
+                sentence_word_total += sentence_words
+                if sentence_words > LONG_SENTENCE_WORDS:
+                    long_sentences += 1
+            sentence_words = 0
+        elif not in_sentence_word:
+            in_sentence_word = True
+            sentence_words += 1
+    
+    if sentence_words > 0:
+        sentences += 1
+        sentence_word_total += sentence_words
+        if sentence_words > LONG_SENTENCE_WORDS:
+            long_sentences += 1
+    if paragraph_words > 0:
+        paragraphs += 1
+        if paragraphs == 1:
+            first_paragraph_words = paragraph_words
+        last_paragraph_words = paragraph_words
+    
+    return (words, sentences, sentence_word_total, long_sentences,
+            paragraphs, first_paragraph_words, last_paragraph_words,
+            group_counts[0], group_counts[1])
+
+
+if NUMBA_AVAILABLE:
+    _COUNT_PATTERNS = _pattern_table((PASSIVE_INDICATORS, FIRST_PERSON))
+    _scan_bytes = njit(cache=True)(_scan_bytes)
+    # Compile (or load from the on-disk cache) at import, not on the first request
+    _scan_bytes(np.frombuffer(b"Warm up the scan. Done!\n\nNext paragraph.", dtype=np.uint8),
+                *_COUNT_PATTERNS)
+
+
+def _scan_essay(essay: str, essay_bytes: bytes) -> EssayScan:
+    """Count words, sentences, paragraphs and clarity patterns in a single pass where possible"""
+    # Non-ASCII text may contain Unicode whitespace that str.split() honours
+    if NUMBA_AVAILABLE and essay.isascii():
+        return EssayScan(*_scan_bytes(np.frombuffer(essay_bytes, dtype=np.uint8), *_COUNT_PATTERNS))
+    return _scan_text(essay, essay_bytes)
+
+
+def _build_automaton(terms: frozenset):
+    """Build an Aho-Corasick automaton over byte-string terms, or None without pyahocorasick"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        # The default (unicode) build of pyahocorasick only accepts str keys
+        automaton.add_word(term.decode() if ahocorasick.unicode else term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_hyperscan_db(terms: frozenset):
+    """
+    Compile byte-string terms into a Hyperscan database, or None without
+    hyperscan. Returns (database, terms) where a match id indexes terms.
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    ordered = tuple(sorted(terms))
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(term.decode()).encode() for term in ordered],
+        ids=list(range(len(ordered))),
+        elements=len(ordered),
+        # Presence is all we need, so report each phrase at most once
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(ordered)
+    )
+    return database, ordered
+
+
+# Hyperscan scratch spaces, one per compiled database in each thread. A
+# scratch can't be shared by concurrent scans, and allocating one per scan
+# costs more than scanning a typical essay. Batch worker processes each get
+# their own copy of this module, so they never share one either.
+_HYPERSCAN_SCRATCH = threading.local()
+
+
+def _hyperscan_scratch(database):
+    """This thread's scratch space for database, allocated on first use"""
+    scratches = getattr(_HYPERSCAN_SCRATCH, "by_database", None)
+    if scratches is None:
+        scratches = _HYPERSCAN_SCRATCH.by_database = {}
+    scratch = scratches.get(id(database))
+    if scratch is None:
+        scratch = scratches[id(database)] = hyperscan.Scratch(database)
+    return scratch
+
+
+@dataclass
+class EssayTokens:
+    """Per-essay state computed once by _tokenize and shared by the analyzers.
+
+    Fields an analysis_type does not need are left as None.
+    """
+    essay: str
+    essay_bytes: Optional[bytes] = None  # lowercased UTF-8, for substring checks
+    scan: Optional[EssayScan] = None     # word/sentence/paragraph counts
+    hits: Optional[frozenset] = None     # known phrases present in the essay
+    
+    @property
+    def word_count(self) -> int:
+        return self.scan.word_count if self.scan is not None else len(self.essay.split())
 
 
 class EssayAnalyzerTool:
@@ -126,8 +429,69 @@ class EssayAnalyzerTool:
         "reduced", "achieved", "published", "presented", "collaborated"
     ]
     
+    # Transitional phrases that signal a well-connected essay
+    TRANSITIONS = [
+        "furthermore", "moreover", "additionally", "however", "nevertheless",
+        "in addition", "consequently", "therefore", "as a result", "specifically",
+        "for example", "for instance", "in particular"
+    ]
+    
+    # Maximum number of suggestions returned by a full analysis
+    MAX_SUGGESTIONS = 5
+    
+    # Weight of each section in the overall score
+    SCORE_WEIGHTS = {
+        "structure": 0.25,
+        "keywords": 0.20,
+        "length": 0.15,
+        "clarity": 0.25,
+        "red_flags": 0.15
+    }
+    
+    # Analyses remembered per tool instance, keyed by essay content hash, so
+    # re-submitting the same essay (e.g. "score my SOP" again) is a lookup.
+    # The agent shares one instance across threads, so the LRU bookkeeping
+    # runs under _result_cache_lock.
+    RESULT_CACHE_SIZE = 128
+    
+    # Lowercased byte forms of the phrase tables, built once. Substring
+    # checks run against the essay encoded and lowercased as bytes, which
+    # uses the tighter bytes search and avoids a lowercased str copy.
+    _CS_KEYWORDS_B = {
+        category: [(kw, kw.lower().encode()) for kw in keywords]
+        for category, keywords in CS_KEYWORDS.items()
+    }
+    _RED_FLAGS_B = [(phrase, phrase.lower().encode()) for phrase in RED_FLAGS]
+    _STRONG_VERBS_B = [verb.encode() for verb in STRONG_VERBS]
+    _TRANSITIONS_B = [t.encode() for t in TRANSITIONS]
+    _FACULTY_TERMS_B = frozenset([b"professor", b"dr.", b"faculty"])
+    _RESEARCH_DETAIL_TERMS_B = frozenset([b"project", b"paper"])
+    _GOAL_TERMS_B = frozenset([b"goal", b"aim", b"future"])
+    
+    # Every phrase looked up by presence, deduplicated across tables, so each
+    # one is searched for once per essay and the analyzers test set membership
+    _TERMS_B = frozenset(
+        [kw_b for keywords in _CS_KEYWORDS_B.values() for _, kw_b in keywords]
+        + [phrase_b for _, phrase_b in _RED_FLAGS_B]
+        + _STRONG_VERBS_B + _TRANSITIONS_B
+        + list(_FACULTY_TERMS_B | _RESEARCH_DETAIL_TERMS_B | _GOAL_TERMS_B | {b"research"})
+    )
+    _TERMS_HYPERSCAN = _build_hyperscan_db(_TERMS_B)
+    _TERMS_AUTOMATON = _build_automaton(_TERMS_B) if _TERMS_HYPERSCAN is None else None
+    
+    # Shared per-essay work each analysis_type depends on:
+    # "bytes" = lowercased essay bytes, "scan" = EssayScan, "hits" = phrase hit set
+    _NEEDS = {
+        "full": frozenset({"bytes", "scan", "hits"}),
+        "structure": frozenset({"bytes", "scan", "hits"}),
+        "keywords": frozenset({"bytes", "hits"}),
+        "length": frozenset(),
+        "clarity": frozenset({"bytes", "scan"})
+    }
+    
     def __init__(self):
-        pass
+        self._result_cache: OrderedDict = OrderedDict()
+        self._result_cache_lock = threading.Lock()
     
     def execute(self, **params) -> Dict[str, Any]:
         """
@@ -146,30 +510,87 @@ class EssayAnalyzerTool:
         if len(essay_text) < 100:
             return self._error("Essay text is too short to analyze. Please provide the full essay.")
         
+        needs = self._NEEDS.get(analysis_type)
+        if needs is None:
+            return self._error(f"Unknown analysis_type: {analysis_type}")
+        
+        cache_key = (
+            hashlib.blake2b(essay_text.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+            analysis_type, target_school, target_program
+        )
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+        if cached is not None:
+            # Copy so callers can't alter the cached analysis
+            return self._success(data=copy.deepcopy(cached))
+        
+        tokens = self._tokenize(essay_text, needs)
+        
         # Perform analysis based on type
         if analysis_type == "full":
-            result = self._full_analysis(essay_text, target_school, target_program)
+            result = self._full_analysis(tokens, target_school, target_program)
         elif analysis_type == "structure":
-            result = self._analyze_structure(essay_text)
+            result = self._analyze_structure(tokens)
         elif analysis_type == "keywords":
-            result = self._analyze_keywords(essay_text, target_program)
+            result = self._analyze_keywords(tokens, target_program)
         elif analysis_type == "length":
-            result = self._analyze_length(essay_text)
-        elif analysis_type == "clarity":
-            result = self._analyze_clarity(essay_text)
-        else:
-            return self._error(f"Unknown analysis_type: {analysis_type}")
+            result = self._analyze_length(tokens)
+        else:  # clarity
+            result = self._analyze_clarity(tokens)
+        
+        cached = copy.deepcopy(result)
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = cached
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
         
         return self._success(data=result)
     
-    def _full_analysis(self, essay: str, school: Optional[str], program: Optional[str]) -> Dict:
+    @classmethod
+    def execute_batch(cls, items: List[Dict[str, Any]],
+                      max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze many essays in parallel worker processes.
+        
+        Each item holds the same parameters as execute(). Results are
+        returned in input order. Analysis is CPU-bound, so processes are
+        used rather than threads.
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(items))
+        if workers <= 1:
+            tool = cls()
+            return [tool.execute(**item) for item in items]
+        
+        # Hand each worker a few chunks so uneven essay lengths balance out
+        chunksize = max(1, len(items) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(cls,)) as pool:
+            return list(pool.map(_execute_in_worker, items, chunksize=chunksize))
+    
+    def _tokenize(self, essay: str, needs: frozenset) -> EssayTokens:
+        """Do the shared per-essay passes once, limited to what `needs` lists"""
+        tokens = EssayTokens(essay)
+        if "bytes" in needs:
+            # Lowercase once, as bytes, for all substring checks
+            tokens.essay_bytes = essay.encode("utf-8", "ignore").lower()
+        if "scan" in needs:
+            # Count words, sentences and paragraphs in one pass
+            tokens.scan = _scan_essay(essay, tokens.essay_bytes)
+        if "hits" in needs:
+            # Find every known phrase once
+            tokens.hits = self._find_terms(tokens.essay_bytes)
+        return tokens
+    
+    def _full_analysis(self, tokens: EssayTokens, school: Optional[str], program: Optional[str]) -> Dict:
         """Perform comprehensive essay analysis"""
-        structure = self._analyze_structure(essay)
-        keywords = self._analyze_keywords(essay, program)
-        length = self._analyze_length(essay)
-        clarity = self._analyze_clarity(essay)
-        red_flags = self._check_red_flags(essay)
-        strong_points = self._identify_strong_points(essay)
+        structure = self._analyze_structure(tokens)
+        keywords = self._analyze_keywords(tokens, program)
+        length = self._analyze_length(tokens)
+        clarity = self._analyze_clarity(tokens)
+        red_flags = self._check_red_flags(tokens)
+        strong_points = self._identify_strong_points(tokens)
         suggestions = self._generate_suggestions(
             structure, keywords, length, clarity, red_flags, school, program
         )
@@ -193,59 +614,63 @@ class EssayAnalyzerTool:
             "target_program": program
         }
     
-    def _analyze_structure(self, essay: str) -> Dict:
+    def _find_terms(self, essay_bytes: bytes) -> frozenset:
+        """Return the known phrases (from _TERMS_B) that occur in the essay"""
+        if self._TERMS_HYPERSCAN is not None:
+            database, terms = self._TERMS_HYPERSCAN
+            found = []
+            database.scan(
+                essay_bytes,
+                match_event_handler=lambda term_id, start, end, flags, context: found.append(terms[term_id]),
+                scratch=_hyperscan_scratch(database)
+            )
+            return frozenset(found)
+        
+        automaton = self._TERMS_AUTOMATON
+        if automaton is not None:
+            # One automaton pass instead of one substring search per phrase.
+            # bytes.lower() only touches ASCII, so the bytes are still valid UTF-8.
+            text = essay_bytes.decode() if ahocorasick.unicode else essay_bytes
+            return frozenset(term for _, term in automaton.iter(text))
+        return frozenset(t for t in self._TERMS_B if t in essay_bytes)
+    
+    def _analyze_structure(self, tokens: EssayTokens) -> Dict:
         """Analyze essay structure"""
-        paragraphs = [p.strip() for p in essay.split('\n\n') if p.strip()]
-        sentences = re.split(r'[.!?]+', essay)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        scan, hits = tokens.scan, tokens.hits
+        paragraph_count = scan.paragraph_count
         
         # Check for key structural elements
-        has_clear_intro = len(paragraphs) > 0 and len(paragraphs[0].split()) >= 50
-        has_clear_conclusion = len(paragraphs) > 2 and len(paragraphs[-1].split()) >= 40
+        has_clear_intro = paragraph_count > 0 and scan.first_paragraph_words >= 50
+        has_clear_conclusion = paragraph_count > 2 and scan.last_paragraph_words >= 40
         
-        # Check paragraph balance
-        para_lengths = [len(p.split()) for p in paragraphs]
-        avg_para_length = sum(para_lengths) / len(para_lengths) if para_lengths else 0
+        # Check paragraph balance (every word belongs to exactly one paragraph)
+        avg_para_length = scan.word_count / paragraph_count if paragraph_count else 0
         
         # Look for transitional phrases
-        transitions = [
-            "furthermore", "moreover", "additionally", "however", "nevertheless",
-            "in addition", "consequently", "therefore", "as a result", "specifically",
-            "for example", "for instance", "in particular"
+        transition_count = sum(1 for t in self._TRANSITIONS_B if t in hits)
+        
+        good_paragraph_count = 3 <= paragraph_count <= 7
+        good_transitions = transition_count >= 3
+        
+        # 25 points per structural element present
+        structure_score = 25 * (has_clear_intro + has_clear_conclusion
+                                + good_paragraph_count + good_transitions)
+        
+        feedback = [
+            "✅ Strong opening paragraph" if has_clear_intro
+            else "⚠️ Consider strengthening your introduction",
+            "✅ Clear conclusion" if has_clear_conclusion
+            else "⚠️ Consider adding a stronger conclusion",
+            f"✅ Good paragraph count ({paragraph_count} paragraphs)" if good_paragraph_count
+            else f"⚠️ Consider restructuring ({paragraph_count} paragraphs - aim for 4-6)",
+            f"✅ Good use of transitions ({transition_count} found)" if good_transitions
+            else "⚠️ Consider adding more transitional phrases"
         ]
-        transition_count = sum(1 for t in transitions if t.lower() in essay.lower())
-        
-        structure_score = 0
-        feedback = []
-        
-        if has_clear_intro:
-            structure_score += 25
-            feedback.append("✅ Strong opening paragraph")
-        else:
-            feedback.append("⚠️ Consider strengthening your introduction")
-        
-        if has_clear_conclusion:
-            structure_score += 25
-            feedback.append("✅ Clear conclusion")
-        else:
-            feedback.append("⚠️ Consider adding a stronger conclusion")
-        
-        if 3 <= len(paragraphs) <= 7:
-            structure_score += 25
-            feedback.append(f"✅ Good paragraph count ({len(paragraphs)} paragraphs)")
-        else:
-            feedback.append(f"⚠️ Consider restructuring ({len(paragraphs)} paragraphs - aim for 4-6)")
-        
-        if transition_count >= 3:
-            structure_score += 25
-            feedback.append(f"✅ Good use of transitions ({transition_count} found)")
-        else:
-            feedback.append("⚠️ Consider adding more transitional phrases")
         
         return {
             "score": structure_score,
-            "paragraph_count": len(paragraphs),
-            "sentence_count": len(sentences),
+            "paragraph_count": paragraph_count,
+            "sentence_count": scan.sentence_count,
             "avg_paragraph_length": round(avg_para_length),
             "has_clear_intro": has_clear_intro,
             "has_clear_conclusion": has_clear_conclusion,
@@ -253,26 +678,25 @@ class EssayAnalyzerTool:
             "feedback": feedback
         }
     
-    def _analyze_keywords(self, essay: str, program: Optional[str]) -> Dict:
+    def _analyze_keywords(self, tokens: EssayTokens, program: Optional[str]) -> Dict:
         """Analyze keyword usage"""
-        essay_lower = essay.lower()
-        
+        hits = tokens.hits
         # Count keyword categories
         category_scores = {}
         found_keywords = {}
         missing_categories = []
         
-        for category, keywords in self.CS_KEYWORDS.items():
-            found = [kw for kw in keywords if kw.lower() in essay_lower]
+        for category, keywords in self._CS_KEYWORDS_B.items():
+            found = [kw for kw, kw_b in keywords if kw_b in hits]
             category_scores[category] = len(found)
             found_keywords[category] = found
             
-            if len(found) == 0:
+            if not found:
                 missing_categories.append(category)
         
-        # Calculate keyword score
+        # Calculate keyword score; every category is either covered or missing
         total_categories = len(self.CS_KEYWORDS)
-        categories_with_keywords = sum(1 for v in category_scores.values() if v > 0)
+        categories_with_keywords = total_categories - len(missing_categories)
         keyword_score = int((categories_with_keywords / total_categories) * 100)
         
         feedback = []
@@ -294,11 +718,10 @@ class EssayAnalyzerTool:
             "feedback": feedback
         }
     
-    def _analyze_length(self, essay: str) -> Dict:
+    def _analyze_length(self, tokens: EssayTokens) -> Dict:
         """Analyze essay length"""
-        words = essay.split()
-        word_count = len(words)
-        char_count = len(essay)
+        word_count = tokens.word_count
+        char_count = len(tokens.essay)
         
         ideal = self.IDEAL_LENGTHS["default"]
         
@@ -324,25 +747,19 @@ class EssayAnalyzerTool:
             "feedback": [feedback]
         }
     
-    def _analyze_clarity(self, essay: str) -> Dict:
+    def _analyze_clarity(self, tokens: EssayTokens) -> Dict:
         """Analyze writing clarity"""
-        sentences = re.split(r'[.!?]+', essay)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        # Calculate average sentence length
-        sentence_lengths = [len(s.split()) for s in sentences]
-        avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths) if sentence_lengths else 0
+        scan = tokens.scan
+        sentence_count = scan.sentence_count
         
-        # Count very long sentences (30+ words)
-        long_sentences = sum(1 for l in sentence_lengths if l > 30)
+        # Average sentence length and very long sentences (30+ words)
+        avg_sentence_length = scan.sentence_word_total / sentence_count if sentence_count else 0
+        long_sentences = scan.long_sentences
         
-        # Count passive voice indicators
-        passive_indicators = ["was", "were", "been", "being", "is being", "are being",
-                             "has been", "have been", "had been"]
-        passive_count = sum(essay.lower().count(p) for p in passive_indicators)
-        
-        # Count first-person pronouns (should be used, but not excessively)
-        first_person = essay.lower().count(" i ") + essay.lower().count("my ")
+        # Passive voice indicators and first-person pronouns (should be
+        # used, but not excessively), counted during the scan
+        passive_count = scan.passive_count
+        first_person = scan.first_person_count
         
         clarity_score = 100
         feedback = []
@@ -360,7 +777,7 @@ class EssayAnalyzerTool:
             feedback.append(f"⚠️ {long_sentences} sentences exceed 30 words")
         
         # Passive voice
-        passive_ratio = passive_count / len(sentences) if sentences else 0
+        passive_ratio = passive_count / sentence_count if sentence_count else 0
         if passive_ratio > 0.3:
             clarity_score -= 10
             feedback.append("⚠️ Consider using more active voice")
@@ -376,13 +793,13 @@ class EssayAnalyzerTool:
             "feedback": feedback
         }
     
-    def _check_red_flags(self, essay: str) -> Dict:
+    def _check_red_flags(self, tokens: EssayTokens) -> Dict:
         """Check for cliché phrases to avoid"""
-        essay_lower = essay.lower()
+        hits = tokens.hits
         found_flags = []
         
-        for phrase in self.RED_FLAGS:
-            if phrase.lower() in essay_lower:
+        for phrase, phrase_b in self._RED_FLAGS_B:
+            if phrase_b in hits:
                 found_flags.append(phrase)
         
         score = max(0, 100 - (len(found_flags) * 15))
@@ -402,31 +819,33 @@ class EssayAnalyzerTool:
             "feedback": feedback
         }
     
-    def _identify_strong_points(self, essay: str) -> List[str]:
+    def _identify_strong_points(self, tokens: EssayTokens) -> List[str]:
         """Identify strong points in the essay"""
+        hits = tokens.hits
         strong_points = []
-        essay_lower = essay.lower()
         
         # Check for strong verbs
-        verb_count = sum(1 for v in self.STRONG_VERBS if v in essay_lower)
+        verb_count = sum(1 for v in self._STRONG_VERBS_B if v in hits)
         if verb_count >= 5:
             strong_points.append(f"Good use of action verbs ({verb_count} found)")
         
         # Check for specific details (numbers, percentages)
-        numbers = re.findall(r'\d+', essay)
-        if len(numbers) >= 3:
+        # Only whether there are at least 3 matters, so stop at the third match
+        # instead of collecting every number in the essay
+        numbers = sum(1 for _ in islice(_NUMBER_RE.finditer(tokens.essay), 3))
+        if numbers >= 3:
             strong_points.append("Includes specific quantitative details")
         
         # Check for faculty mentions
-        if "professor" in essay_lower or "dr." in essay_lower or "faculty" in essay_lower:
+        if hits & self._FACULTY_TERMS_B:
             strong_points.append("Mentions specific faculty or professors")
         
         # Check for research mentions
-        if "research" in essay_lower and ("project" in essay_lower or "paper" in essay_lower):
+        if b"research" in hits and hits & self._RESEARCH_DETAIL_TERMS_B:
             strong_points.append("Discusses research experience")
         
         # Check for future goals
-        if "goal" in essay_lower or "aim" in essay_lower or "future" in essay_lower:
+        if hits & self._GOAL_TERMS_B:
             strong_points.append("Articulates future goals")
         
         return strong_points
@@ -435,54 +854,59 @@ class EssayAnalyzerTool:
         self, structure: Dict, keywords: Dict, length: Dict,
         clarity: Dict, red_flags: Dict, school: Optional[str], program: Optional[str]
     ) -> List[str]:
-        """Generate specific improvement suggestions"""
+        """Generate specific improvement suggestions (top 5, in priority order)"""
         suggestions = []
         
+        def add(suggestion: str) -> bool:
+            """Append a suggestion; True once the list is full"""
+            suggestions.append(suggestion)
+            return len(suggestions) >= self.MAX_SUGGESTIONS
+        
         # Structure suggestions
         if structure["score"] < 75:
-            suggestions.append("Strengthen your essay structure with a clear introduction, body paragraphs, and conclusion")
+            if add("Strengthen your essay structure with a clear introduction, body paragraphs, and conclusion"):
+                return suggestions
         
         # Keyword suggestions
-        if keywords["missing_categories"]:
-            for cat in keywords["missing_categories"][:2]:
-                suggestions.append(f"Add content related to {cat}")
+        for cat in keywords["missing_categories"][:2]:
+            if add(f"Add content related to {cat}"):
+                return suggestions
         
         # Length suggestions
         if length["status"] == "too_short":
-            suggestions.append("Expand on your experiences and motivations with specific examples")
+            if add("Expand on your experiences and motivations with specific examples"):
+                return suggestions
         elif length["status"] == "too_long":
-            suggestions.append("Remove redundant phrases and focus on your strongest points")
+            if add("Remove redundant phrases and focus on your strongest points"):
+                return suggestions
         
         # Clarity suggestions
         if clarity["score"] < 80:
-            suggestions.append("Shorten long sentences for better readability")
+            if add("Shorten long sentences for better readability"):
+                return suggestions
         
         # Red flag suggestions
         if red_flags["count"] > 0:
-            suggestions.append("Replace cliché phrases with specific, personal statements")
+            if add("Replace cliché phrases with specific, personal statements"):
+                return suggestions
         
         # School-specific suggestions
         if school:
-            suggestions.append(f"Mention why {school} specifically fits your goals")
+            if add(f"Mention why {school} specifically fits your goals"):
+                return suggestions
         
         # Program-specific suggestions
         if program:
-            suggestions.append(f"Reference specific aspects of the {program} program")
+            add(f"Reference specific aspects of the {program} program")
         
-        return suggestions[:5]  # Return top 5 suggestions
+        return suggestions
     
     def _calculate_overall_score(
         self, structure: Dict, keywords: Dict, length: Dict,
         clarity: Dict, red_flags: Dict
     ) -> int:
         """Calculate weighted overall score"""
-        weights = {
-            "structure": 0.25,
-            "keywords": 0.20,
-            "length": 0.15,
-            "clarity": 0.25,
-            "red_flags": 0.15
-        }
+        weights = self.SCORE_WEIGHTS
         
         score = (
             structure["score"] * weights["structure"] +
@@ -508,6 +932,20 @@ class EssayAnalyzerTool:
         return {"success": False, "error": message}
 
 
+# One tool instance per execute_batch worker process, built by the pool
+# initializer so tasks only ship their parameters
+_worker_tool: Optional[EssayAnalyzerTool] = None
+
+
+def _init_batch_worker(tool_cls: type) -> None:
+    global _worker_tool
+    _worker_tool = tool_cls()
+
+
+def _execute_in_worker(params: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_tool.execute(**params)
+
+
 # ============================================
 # Tool Registration for Agent
 # ============================================
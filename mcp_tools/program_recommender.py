@@ -23,11 +23,66 @@ Tool Schema:
 }
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
+from itertools import islice
+import asyncio
+import copy
+import hashlib
 import os
 import json
-from openai import OpenAI
+import re
+import threading
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+# ijson parses the AI reply incrementally while it streams in.
+# If not available, we wait for the whole reply and parse it at once.
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# FAISS backs the optional semantic cache of AI recommendations.
+# If not available, only exact prompt matches are cached.
+try:
+    import numpy as np
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# HTTP/2 lets concurrent requests share one connection; httpx needs h2 for it.
+# If not available, the shared clients speak HTTP/1.1 with keep-alive.
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20)
+
+# One OpenAI client per API key, shared by every ProgramRecommenderTool so
+# their requests reuse the same keep-alive TCP/TLS connections
+_shared_clients: Dict[str, OpenAI] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenRouter client for api_key, creating it once"""
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                base_url=OPENROUTER_BASE_URL,
+                http_client=httpx.Client(http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS, follow_redirects=True)
+            )
+            _shared_clients[api_key] = client
+        return client
 
 
 class ProgramRecommenderTool:
@@ -130,6 +185,128 @@ class ProgramRecommenderTool:
         ]
     }
 
+    # Simple tier heuristic for existing applications, based on school names.
+    # Each set is one alternation, so a name is checked in a single regex scan.
+    # Keywords match whole words only, so "mit" doesn't hit "Smith College".
+    REACH_SCHOOLS = {"mit", "stanford", "carnegie mellon", "berkeley", "cmu", "caltech", "princeton"}
+    MATCH_SCHOOLS = {"georgia tech", "usc", "ut austin", "washington", "uiuc", "wisconsin", "maryland"}
+    _REACH_SCHOOLS_RE = re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, sorted(REACH_SCHOOLS))))
+    _MATCH_SCHOOLS_RE = re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, sorted(MATCH_SCHOOLS))))
+
+    # Profile section of the AI prompt, filled with str.format_map
+    _PROFILE_TEMPLATE = """
+GPA: {gpa}
+GRE Verbal: {gre_verbal}
+GRE Quant: {gre_quant}
+Research Interests: {research_interests}
+Target Degree: {target_degree}
+Preferred Locations: {preferred_locations}
+"""
+
+    # AI recommendation lists keyed by a hash of the prompt (which embeds the
+    # profile, applications and options), so asking again with nothing
+    # changed skips the API round-trip. Shared by all instances, since the
+    # API builds a new tool per request.
+    AI_CACHE_SIZE = 128
+    _ai_cache: OrderedDict = OrderedDict()
+    _ai_cache_lock = threading.Lock()
+
+    # Maximum concurrent AI requests from execute_batch
+    AI_BATCH_CONCURRENCY = 10
+
+    # Opt-in semantic cache (RECOMMENDER_SEMANTIC_CACHE=1, needs faiss and an
+    # embeddings endpoint): a profile and application list whose embedding is
+    # nearly identical to an earlier one (e.g. GPA 3.80 vs 3.81) reuses that
+    # request's recommendations. Only the profile context is embedded; focus,
+    # degree type and count must match exactly, so each combination has its
+    # own index. _semantic_indexes maps (focus, degree_type, num_recs) to
+    # (index, recommendation lists by row), shared by all instances like
+    # _ai_cache and guarded by _semantic_lock.
+    SEMANTIC_CACHE_MODEL = "text-embedding-3-small"
+    SEMANTIC_CACHE_THRESHOLD = 0.97
+    SEMANTIC_CACHE_SIZE = 1024
+    _semantic_indexes: Dict[Tuple[str, str, Optional[int]], Tuple[Any, List[List[Dict]]]] = {}
+    _semantic_lock = threading.Lock()
+
+    # PROGRAM_DATABASE flattened into tier-tagged copies, and for each of them
+    # the indices of its similar programs, nearest rank first. _SCHOOL_NAMES
+    # holds the lowercased school names in the same order, and _SCHOOL_INDEX
+    # maps each of them to the first program whose name contains it.
+    # _TIER_INDICES lists the positions of each tier's entries, and
+    # _PREFILTERED the rank-sorted positions for each (tier, degree type)
+    # pair the schema allows (tier None meaning every tier).
+    # Built once on first use by _ensure_index().
+    _ALL_PROGRAMS: Optional[List[Dict]] = None
+    _SIMILAR: Optional[List[List[int]]] = None
+    _SCHOOL_NAMES: Optional[List[str]] = None
+    _SCHOOL_INDEX: Optional[Dict[str, int]] = None
+    _TIER_INDICES: Optional[Dict[str, List[int]]] = None
+    _PREFILTERED: Optional[Dict[Tuple[Optional[str], str], List[int]]] = None
+
+    # "focus" parameter values -> PROGRAM_DATABASE tiers
+    _FOCUS_TIERS = {"safety": "Safety", "match": "Match", "reach": "Reach"}
+
+    @classmethod
+    def _ensure_index(cls) -> None:
+        """Flatten PROGRAM_DATABASE and rank every program's similar programs once"""
+        if cls._ALL_PROGRAMS is not None:
+            return
+
+        # Copies, so tagging the tier never touches PROGRAM_DATABASE itself
+        programs = [
+            dict(prog, tier=tier)
+            for tier, tier_programs in cls.PROGRAM_DATABASE.items()
+            for prog in tier_programs
+        ]
+
+        similar = []
+        for target in programs:
+            # Similar if same tier or rank within 10, excluding the school itself
+            neighbours = [
+                i for i, prog in enumerate(programs)
+                if prog["school"] != target["school"]
+                and (prog["tier"] == target["tier"] or abs(prog["rank"] - target["rank"]) <= 10)
+            ]
+            # Sort by rank similarity (stable, so ties keep database order)
+            neighbours.sort(key=lambda i: abs(programs[i]["rank"] - target["rank"]))
+            similar.append(neighbours)
+
+        names = [prog["school"].lower() for prog in programs]
+        # Resolved as a substring search would: a full name may also occur
+        # inside an earlier school's name
+        school_index = {}
+        for name in names:
+            if name not in school_index:
+                school_index[name] = next(i for i, other in enumerate(names) if name in other)
+
+        tier_indices = {tier: [] for tier in cls.PROGRAM_DATABASE}
+        for i, prog in enumerate(programs):
+            tier_indices[prog["tier"]].append(i)
+
+        cls._SIMILAR = similar
+        cls._TIER_INDICES = tier_indices
+        cls._PREFILTERED = {
+            (tier, degree_type): cls._prefilter(programs, tier_indices, tier, degree_type)
+            for tier in [None, *cls.PROGRAM_DATABASE]
+            for degree_type in ("MS", "PhD", "MBA", "Any")
+        }
+        cls._SCHOOL_NAMES = names
+        cls._SCHOOL_INDEX = school_index
+        cls._ALL_PROGRAMS = programs
+
+    @staticmethod
+    def _prefilter(programs: List[Dict], tier_indices: Dict[str, List[int]],
+                   tier: Optional[str], degree_type: str) -> List[int]:
+        """Positions of a tier's programs offering degree_type, best rank first"""
+        indices = range(len(programs)) if tier is None else tier_indices.get(tier, [])
+        matching = [
+            i for i in indices
+            if degree_type == "Any" or degree_type in programs[i].get("degree", [])
+        ]
+        # Stable, so ties keep database order
+        matching.sort(key=lambda i: programs[i].get("rank", 999))
+        return matching
+
     def __init__(self, db_manager):
         """
         Initialize the recommender tool.
@@ -142,14 +319,15 @@ class ProgramRecommenderTool:
         # Initialize OpenAI client for AI recommendations
         api_key = os.getenv('OPENROUTER_API_KEY') or os.getenv('OPENAI_API_KEY')
         if api_key:
-            self.client = OpenAI(
-                api_key=api_key,
-                base_url="https://openrouter.ai/api/v1"
-            )
+            self.client = _get_shared_client(api_key)
         else:
             self.client = None
             print("⚠️ No API key found for AI recommendations. Using rule-based recommendations.")
 
+        self._semantic_cache_enabled = bool(
+            FAISS_AVAILABLE and self.client and os.getenv("RECOMMENDER_SEMANTIC_CACHE") == "1"
+        )
+
     def execute(self, **params) -> Dict[str, Any]:
         """Execute the recommender tool with given parameters."""
         action = params.get("action")
@@ -173,6 +351,42 @@ class ProgramRecommenderTool:
         except Exception as e:
             return self._error(f"Error executing {action}: {str(e)}")
 
+    def execute_batch(self, params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several tool calls, sending their AI recommendation requests
+        concurrently instead of one after another.
+
+        Results are returned in input order. This runs its own event loop, so
+        call it from synchronous code.
+        """
+        return asyncio.run(self._execute_batch_async(params_list))
+
+    async def _execute_batch_async(self, params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(params_list)
+        ai_indices = []
+
+        for i, params in enumerate(params_list):
+            if self.client and params.get("action") == "get_recommendations":
+                ai_indices.append(i)
+            else:
+                results[i] = self.execute(**params)
+
+        if ai_indices:
+            # A client per batch: async connections belong to this event loop.
+            # Over HTTP/2 the batch's requests multiplex on one connection.
+            http_client = httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS, follow_redirects=True)
+            async with AsyncOpenAI(api_key=self.client.api_key, base_url=self.client.base_url,
+                                   http_client=http_client) as client:
+                semaphore = asyncio.Semaphore(self.AI_BATCH_CONCURRENCY)
+                batch = await asyncio.gather(*(
+                    self._get_recommendations_async(client, semaphore, params_list[i])
+                    for i in ai_indices
+                ))
+            for i, result in zip(ai_indices, batch):
+                results[i] = result
+
+        return results
+
     def _get_recommendations(self, params: Dict) -> Dict[str, Any]:
         """
         Get AI-powered program recommendations based on user's profile and applications.
@@ -197,6 +411,32 @@ class ProgramRecommenderTool:
                 existing_apps, profile, num_recs, focus, degree_type
             )
 
+        return self._recommendations_response(existing_apps, profile, recommendations)
+
+    async def _get_recommendations_async(self, client: AsyncOpenAI, semaphore: asyncio.Semaphore,
+                                         params: Dict) -> Dict[str, Any]:
+        """Async variant of _get_recommendations for execute_batch (AI path only)"""
+        num_recs = params.get("num_recommendations", 5)
+        focus = params.get("focus", "all")
+        degree_type = params.get("degree_type", "Any")
+
+        try:
+            # Both reads open their own SQLite connection, so they can run
+            # side by side on worker threads without blocking the event loop
+            existing_apps, profile = await asyncio.gather(
+                asyncio.to_thread(self.db.get_all_applications),
+                asyncio.to_thread(self.db.get_user_profile),
+            )
+            recommendations = await self._ai_recommendations_async(
+                client, semaphore, existing_apps, profile, num_recs, focus, degree_type
+            )
+            return self._recommendations_response(existing_apps, profile, recommendations)
+        except Exception as e:
+            return self._error(f"Error executing get_recommendations: {str(e)}")
+
+    def _recommendations_response(self, existing_apps: List, profile: Dict,
+                                  recommendations: List[Dict]) -> Dict[str, Any]:
+        """Wrap a recommendation list in the get_recommendations response"""
         return self._success(
             message=f"Generated {len(recommendations)} program recommendations",
             data={
@@ -216,10 +456,7 @@ class ProgramRecommenderTool:
         profile = self.db.get_user_profile()
 
         # Count applications by status
-        by_status = {}
-        for app in existing_apps:
-            status = app.get("status", "unknown")
-            by_status[status] = by_status.get(status, 0) + 1
+        by_status = dict(Counter(app.get("status", "unknown") for app in existing_apps))
 
         # Analyze school tiers (if we can infer from existing apps)
         school_analysis = self._analyze_school_tiers(existing_apps)
@@ -272,46 +509,26 @@ class ProgramRecommenderTool:
         if not similar_to:
             return self._error("Missing required parameter: similar_to_school")
 
-        # Find similar programs from our database
-        similar_programs = []
-
-        # Flatten all programs
-        all_programs = []
-        for tier, programs in self.PROGRAM_DATABASE.items():
-            for prog in programs:
-                prog["tier"] = tier
-                all_programs.append(prog)
-
-        # Simple similarity: same tier and close rank
-        target_school = None
+        self._ensure_index()
+        all_programs = self._ALL_PROGRAMS
         similar_to_lower = similar_to.lower()
 
-        # Find the target school
-        for prog in all_programs:
-            if similar_to_lower in prog["school"].lower():
-                target_school = prog
-                break
+        # Find the target school: a full name is a dict hit, anything else
+        # falls back to the first school whose name contains it
+        target_idx = self._SCHOOL_INDEX.get(similar_to_lower)
+        if target_idx is None:
+            target_idx = next(
+                (i for i, name in enumerate(self._SCHOOL_NAMES) if similar_to_lower in name),
+                None
+            )
 
-        if not target_school:
+        if target_idx is None:
             return self._error(f"School '{similar_to}' not found in database")
 
-        # Find similar schools (same tier, similar rank)
-        target_rank = target_school["rank"]
-        target_tier = target_school["tier"]
-
-        for prog in all_programs:
-            if prog["school"] == target_school["school"]:
-                continue  # Skip the target school itself
-
-            # Similar if same tier or rank within 10
-            if prog["tier"] == target_tier or abs(prog["rank"] - target_rank) <= 10:
-                similar_programs.append(prog)
-
-        # Sort by rank similarity
-        similar_programs.sort(key=lambda p: abs(p["rank"] - target_rank))
-
-        # Limit to requested number
-        similar_programs = similar_programs[:num_recs]
+        # Similar programs were ranked when the index was built; copy the
+        # requested number so callers can't alter the cached entries
+        target_school = dict(all_programs[target_idx])
+        similar_programs = [dict(all_programs[i]) for i in self._SIMILAR[target_idx][:num_recs]]
 
         return self._success(
             message=f"Found {len(similar_programs)} programs similar to {target_school['school']}",
@@ -326,30 +543,102 @@ class ProgramRecommenderTool:
         """
         Use AI to generate personalized recommendations.
         """
-        # Build context for AI
+        prompt = self._build_ai_prompt(existing_apps, profile, num_recs, focus, degree_type)
+
+        cache_key, cached = self._ai_cache_lookup(prompt)
+        if cached is not None:
+            return cached
+
+        embedding = None
+        semantic_key = (focus, degree_type, num_recs)
+        if self._semantic_cache_enabled:
+            try:
+                embedding = self._embed_context(self._prompt_context(existing_apps, profile, degree_type))
+                cached = self._semantic_cache_lookup(semantic_key, embedding)
+            except Exception as e:
+                print(f"Semantic cache lookup failed: {e}")
+            if cached is not None:
+                return cached
+
+        try:
+            if IJSON_AVAILABLE:
+                recommendations = self._stream_ai_recommendations(prompt)
+            else:
+                response = self.client.chat.completions.create(**self._ai_request(prompt))
+                recommendations = self._parse_ai_response(response)
+        except Exception as e:
+            print(f"AI recommendation failed: {e}")
+            recommendations = None
+
+        if recommendations is None:
+            # Fallback to rule-based
+            return self._rule_based_recommendations(
+                existing_apps, profile, num_recs, focus, degree_type
+            )
+
+        self._ai_cache_store(cache_key, recommendations)
+        if embedding is not None:
+            self._semantic_cache_store(semantic_key, embedding, recommendations)
+        return recommendations
+
+    async def _ai_recommendations_async(self, client: AsyncOpenAI, semaphore: asyncio.Semaphore,
+                                        existing_apps: List, profile: Dict,
+                                        num_recs: int, focus: str, degree_type: str) -> List[Dict]:
+        """
+        Async variant of _ai_recommendations for execute_batch; at most
+        AI_BATCH_CONCURRENCY requests are in flight at once.
+        """
+        prompt = self._build_ai_prompt(existing_apps, profile, num_recs, focus, degree_type)
+
+        cache_key, cached = self._ai_cache_lookup(prompt)
+        if cached is not None:
+            return cached
+
+        try:
+            async with semaphore:
+                response = await client.chat.completions.create(**self._ai_request(prompt))
+            recommendations = self._parse_ai_response(response)
+        except Exception as e:
+            print(f"AI recommendation failed: {e}")
+            recommendations = None
+
+        if recommendations is None:
+            return self._rule_based_recommendations(
+                existing_apps, profile, num_recs, focus, degree_type
+            )
+
+        self._ai_cache_store(cache_key, recommendations)
+        return recommendations
+
+    def _prompt_context(self, existing_apps: List, profile: Dict, degree_type: str) -> str:
+        """The student profile and current applications sections of the prompt"""
         apps_summary = "\n".join([
             f"- {app['school_name']} - {app['program_name']} ({app['degree_type']})"
             for app in existing_apps
         ])
 
-        profile_summary = f"""
-GPA: {profile.get('gpa', 'Not provided')}
-GRE Verbal: {profile.get('gre_verbal', 'Not provided')}
-GRE Quant: {profile.get('gre_quant', 'Not provided')}
-Research Interests: {profile.get('research_interests', 'Not provided')}
-Target Degree: {profile.get('target_degree', degree_type)}
-Preferred Locations: {profile.get('preferred_locations', 'Not provided')}
-"""
+        # Missing profile fields read as "Not provided", except the target
+        # degree, which defaults to the requested degree type
+        profile_fields = defaultdict(lambda: "Not provided", profile)
+        profile_fields.setdefault("target_degree", degree_type)
+        profile_summary = self._PROFILE_TEMPLATE.format_map(profile_fields)
+
+        return f"""STUDENT PROFILE:
+{profile_summary}
+
+CURRENT APPLICATIONS:
+{apps_summary if apps_summary else "None yet"}"""
+
+    def _build_ai_prompt(self, existing_apps: List, profile: Dict,
+                         num_recs: int, focus: str, degree_type: str) -> str:
+        """Build the recommendation prompt from the profile and applications"""
+        context = self._prompt_context(existing_apps, profile, degree_type)
 
         prompt = f"""You are an expert graduate school admissions advisor.
 
 Based on the student's profile and existing applications, recommend {num_recs} graduate programs they should consider.
 
-STUDENT PROFILE:
-{profile_summary}
-
-CURRENT APPLICATIONS:
-{apps_summary if apps_summary else "None yet"}
+{context}
 
 FOCUS: {focus} schools ({focus == 'safety' and 'higher acceptance rate' or focus == 'match' and 'good fit' or focus == 'reach' and 'competitive' or 'balanced mix'})
 
@@ -374,34 +663,154 @@ Focus on programs that:
 4. Are different from their existing applications (avoid duplicates)
 """
 
-        try:
-            response = self.client.chat.completions.create(
-                model="anthropic/claude-3.5-sonnet",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000
-            )
+        return prompt
+
+    def _ai_request(self, prompt: str) -> Dict[str, Any]:
+        """Chat-completion arguments shared by the sync and async clients"""
+        return {
+            "model": "anthropic/claude-3.5-sonnet",
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 2000,
+            # Ask for a bare JSON object so the reply parses without extraction
+            "response_format": {"type": "json_object"}
+        }
+
+    def _stream_ai_recommendations(self, prompt: str) -> Optional[List[Dict]]:
+        """
+        Stream the AI reply and parse recommendations as they arrive, so
+        the reply is parsed by the time its last chunk lands. Returns every
+        recommendation in the reply, as the non-streamed path does.
 
-            result_text = response.choices[0].message.content.strip()
+        If the JSON can't be parsed incrementally (or holds no list of
+        recommendations), the full text is parsed exactly as a non-streamed
+        reply would be.
+        """
+        stream = self.client.chat.completions.create(stream=True, **self._ai_request(prompt))
+        chunks = []
+        parsed = ijson.sendable_list()
+        parser = ijson.items_coro(parsed, "recommendations.item", use_float=True)
+        in_json = False
+
+        try:
+            for event in stream:
+                text = event.choices[0].delta.content if event.choices else None
+                if not text:
+                    continue
+                chunks.append(text)
+                if parser is None:
+                    continue
+
+                # Skip any prose before the JSON object
+                if not in_json:
+                    brace = text.find("{")
+                    if brace < 0:
+                        continue
+                    text = text[brace:]
+                    in_json = True
+
+                try:
+                    parser.send(text.encode())
+                except ijson.JSONError:
+                    parser = None
+        finally:
+            stream.close()
+
+        if parser is not None and in_json:
+            try:
+                parser.close()
+            except ijson.JSONError:
+                parser = None
+            if parser is not None and parsed:
+                return list(parsed)
+        return self._parse_ai_text("".join(chunks))
+
+    def _parse_ai_response(self, response) -> Optional[List[Dict]]:
+        """Extract the recommendation list, or None if the reply has no JSON object"""
+        return self._parse_ai_text(response.choices[0].message.content)
+
+    def _parse_ai_text(self, result_text: str) -> Optional[List[Dict]]:
+        """Parse the recommendation list out of the reply text"""
+        result_text = result_text.strip()
+
+        # JSON mode replies are the object itself
+        try:
+            result = json.loads(result_text)
+        except ValueError:
+            result = None
 
-            # Parse JSON from response
-            import re
+        # Models that ignore response_format may wrap the object in prose
+        if not isinstance(result, dict):
             json_match = re.search(r'\{.*\}', result_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-                return result.get("recommendations", [])
-            else:
-                # Fallback to rule-based
-                return self._rule_based_recommendations(
-                    existing_apps, profile, num_recs, focus, degree_type
+            if not json_match:
+                return None
+            result = json.loads(json_match.group())
+
+        return result.get("recommendations", [])
+
+    def _ai_cache_lookup(self, prompt: str):
+        """Return (cache key, copy of the cached recommendations or None)"""
+        # Any change to the profile or applications changes the prompt, and
+        # with it the key, so stale entries are never served
+        cache_key = hashlib.sha256(prompt.encode()).hexdigest()
+        with self._ai_cache_lock:
+            cached = self._ai_cache.get(cache_key)
+            if cached is None:
+                return cache_key, None
+            self._ai_cache.move_to_end(cache_key)
+        return cache_key, copy.deepcopy(cached)
+
+    def _ai_cache_store(self, cache_key: str, recommendations: List[Dict]) -> None:
+        """Remember a parsed AI response, evicting the least recently used"""
+        recommendations = copy.deepcopy(recommendations)
+        with self._ai_cache_lock:
+            self._ai_cache[cache_key] = recommendations
+            if len(self._ai_cache) > self.AI_CACHE_SIZE:
+                self._ai_cache.popitem(last=False)
+
+    def _embed_context(self, text: str) -> "np.ndarray":
+        """Embed a profile context as a unit-length float32 row for the semantic cache"""
+        response = self.client.embeddings.create(model=self.SEMANTIC_CACHE_MODEL, input=text)
+        vector = np.asarray([response.data[0].embedding], dtype=np.float32)
+        faiss.normalize_L2(vector)
+        return vector
+
+    def _semantic_cache_lookup(self, key: Tuple, embedding: "np.ndarray") -> Optional[List[Dict]]:
+        """
+        Return a copy of the recommendations cached under key for the most
+        similar profile context, if close enough
+        """
+        with self._semantic_lock:
+            entry = self._semantic_indexes.get(key)
+            if entry is None:
+                return None
+            index, results = entry
+            # Inner product of unit vectors is cosine similarity
+            scores, ids = index.search(embedding, 1)
+            if scores[0, 0] < self.SEMANTIC_CACHE_THRESHOLD:
+                return None
+            cached = results[ids[0, 0]]
+        return copy.deepcopy(cached)
+
+    def _semantic_cache_store(self, key: Tuple, embedding: "np.ndarray", recommendations: List[Dict]) -> None:
+        """Add a profile context embedding and its recommendations to key's index"""
+        recommendations = copy.deepcopy(recommendations)
+        with self._semantic_lock:
+            entry = self._semantic_indexes.get(key)
+            # A flat index can't evict single entries, so start over when full.
+            # Embeddings are kept as float16, half the memory of float32; the
+            # scores shift by ~1e-5, far inside SEMANTIC_CACHE_THRESHOLD's margin.
+            if entry is None or entry[0].ntotal >= self.SEMANTIC_CACHE_SIZE:
+                entry = self._semantic_indexes[key] = (
+                    faiss.IndexScalarQuantizer(
+                        embedding.shape[1], faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+                    ),
+                    []
                 )
-
-        except Exception as e:
-            print(f"AI recommendation failed: {e}")
-            return self._rule_based_recommendations(
-                existing_apps, profile, num_recs, focus, degree_type
-            )
+            index, results = entry
+            index.add(embedding)
+            results.append(recommendations)
 
     def _rule_based_recommendations(self, existing_apps: List, profile: Dict,
                                     num_recs: int, focus: str, degree_type: str) -> List[Dict]:
@@ -409,37 +818,28 @@ Focus on programs that:
         Generate recommendations using rules (fallback when AI unavailable).
         """
         # Get schools already applied to
-        applied_schools = set([app.get("school_name", "").lower() for app in existing_apps])
+        applied_schools = {app.get("school_name", "").lower() for app in existing_apps}
 
-        # Filter programs based on focus
-        candidates = []
-
-        if focus == "all":
-            for tier, programs in self.PROGRAM_DATABASE.items():
-                candidates.extend([{**p, "tier": tier} for p in programs])
-        else:
-            tier_map = {"safety": "Safety", "match": "Match", "reach": "Reach"}
-            tier = tier_map.get(focus, "Match")
-            candidates = [{**p, "tier": tier} for p in self.PROGRAM_DATABASE.get(tier, [])]
-
-        # Filter out schools already applied to
-        candidates = [
-            p for p in candidates
-            if p["school"].lower() not in applied_schools
-        ]
+        # Candidates for this focus and degree type come pre-filtered and
+        # rank-sorted from the shared index; only the final picks are
+        # copied below
+        self._ensure_index()
+        programs = self._ALL_PROGRAMS
+        names = self._SCHOOL_NAMES
 
-        # Filter by degree type if specified
-        if degree_type != "Any":
-            candidates = [
-                p for p in candidates
-                if degree_type in p.get("degree", [])
-            ]
+        tier = None if focus == "all" else self._FOCUS_TIERS.get(focus, "Match")
+        ranked = self._PREFILTERED.get((tier, degree_type))
+        if ranked is None:
+            # Degree type outside the schema's enum
+            ranked = self._prefilter(programs, self._TIER_INDICES, tier, degree_type)
 
-        # Sort by rank (better schools first)
-        candidates.sort(key=lambda p: p.get("rank", 999))
+        # Top N by rank (better schools first), skipping schools already
+        # applied to; num_recs None means no limit
+        limit = None if num_recs is None else max(num_recs, 0)
+        top = list(islice((programs[i] for i in ranked if names[i] not in applied_schools), limit))
 
-        # Take top N
-        recommendations = candidates[:num_recs]
+        # Copied so the reasoning below doesn't touch the index
+        recommendations = [dict(p) for p in top]
 
         # Add reasoning
         for rec in recommendations:
@@ -455,25 +855,18 @@ Focus on programs that:
         """
         Analyze the tier distribution of existing applications.
         """
-        tiers = {"safety": 0, "match": 0, "reach": 0, "unknown": 0}
-
-        # Simple heuristic based on school names
-        reach_schools = {"mit", "stanford", "carnegie mellon", "berkeley", "cmu", "caltech", "princeton"}
-        match_schools = {"georgia tech", "usc", "ut austin", "washington", "uiuc", "wisconsin", "maryland"}
-
-        for app in applications:
-            school_lower = app.get("school_name", "").lower()
-
-            if any(reach in school_lower for reach in reach_schools):
-                tiers["reach"] += 1
-            elif any(match in school_lower for match in match_schools):
-                tiers["match"] += 1
-            elif school_lower:
-                tiers["safety"] += 1
-            else:
-                tiers["unknown"] += 1
-
-        return tiers
+        # Seeded so every tier is reported, in a fixed order
+        tiers = Counter({"safety": 0, "match": 0, "reach": 0, "unknown": 0})
+        tiers.update(self._school_tier(app.get("school_name", "").lower()) for app in applications)
+        return dict(tiers)
+
+    def _school_tier(self, school_lower: str) -> str:
+        """Classify a lowercased school name as reach, match, safety or unknown"""
+        if self._REACH_SCHOOLS_RE.search(school_lower):
+            return "reach"
+        if self._MATCH_SCHOOLS_RE.search(school_lower):
+            return "match"
+        return "safety" if school_lower else "unknown"
 
     def _success(self, message: str = None, data: Any = None) -> Dict[str, Any]:
         """Create a success response"""
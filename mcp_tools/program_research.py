@@ -24,16 +24,146 @@ Tool Schema:
 }
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import json
-import os
+from typing import Dict, Any, Optional, List, Tuple
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+import unicodedata
 
 # Optional: For real web search, we could use libraries like:
 # - requests + BeautifulSoup for web scraping
 # - serpapi for Google search
 # - duckduckgo_search for DuckDuckGo search
 
+
+# Trie node key holding the canonical name of the alias ending there
+_ALIAS_END = "$"
+
+# Punctuation folded out of names before alias matching: dots and
+# apostrophes dropped ("u.c." -> "uc"), separators turned into spaces
+_NAME_PUNCTUATION = str.maketrans({".": None, "'": None, "-": " ", "_": " ", ",": " ", "/": " "})
+
+
+def _fold_name(name: str) -> str:
+    """Lowercase ASCII form of a name for alias matching ("Zürich-ETH" -> "zurich eth")"""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return " ".join(ascii_name.translate(_NAME_PUNCTUATION).lower().split())
+
+
+def _build_alias_trie(aliases: Dict[str, str], exact_only: frozenset = frozenset()) -> Dict:
+    """Build a character trie of lowercase aliases -> canonical names"""
+    root = {}
+    for alias, canonical in aliases.items():
+        if alias in exact_only:
+            continue
+        node = root
+        for char in alias:
+            node = node.setdefault(char, {})
+        node[_ALIAS_END] = canonical
+    return root
+
+
+def _longest_alias(trie: Dict, text: str, trailing_words: Optional[frozenset] = None) -> Optional[str]:
+    """
+    Canonical name of the longest alias that starts text and ends on a word
+    boundary (so "cs phd" resolves via "cs", but "caltech" not via "cal").
+
+    With trailing_words, an alias only counts if every word after it is one
+    of them, so "mit phd" resolves via "mit" but "mit wpu" doesn't.
+    """
+    node = trie
+    found = None
+    for i, char in enumerate(text):
+        node = node.get(char)
+        if node is None:
+            break
+        if _ALIAS_END in node and (i + 1 == len(text) or not text[i + 1].isalnum()):
+            if trailing_words is None or trailing_words.issuperset(text[i + 1:].split()):
+                found = node[_ALIAS_END]
+    return found
+
+
+def _fuzzy_alias(trie: Dict, text: str, max_dist: int) -> Optional[str]:
+    """
+    Canonical name of the alias closest to text by Levenshtein distance, if
+    within max_dist edits and not tied with another school. Walks the trie
+    with one DP row per node, skipping subtrees already over max_dist.
+    """
+    matches = {}
+
+    def walk(node: Dict, previous_row: List[int]) -> None:
+        for char, child in node.items():
+            if char == _ALIAS_END:
+                continue
+            row = [previous_row[0] + 1]
+            for i, text_char in enumerate(text, 1):
+                row.append(min(row[i - 1] + 1, previous_row[i] + 1, previous_row[i - 1] + (text_char != char)))
+            if _ALIAS_END in child and row[-1] <= max_dist:
+                canonical = child[_ALIAS_END]
+                matches[canonical] = min(row[-1], matches.get(canonical, row[-1]))
+            if min(row) <= max_dist:
+                walk(child, row)
+
+    walk(trie, list(range(len(text) + 1)))
+    if not matches:
+        return None
+    best = min(matches.values())
+    closest = [canonical for canonical, dist in matches.items() if dist == best]
+    return closest[0] if len(closest) == 1 else None
+
+
+def _trigrams(text: str) -> set:
+    """Character trigrams of text, space-padded"""
+    padded = " %s " % text
+    return {padded[i:i + 3] for i in range(len(padded) - 2)} if text.strip() else set()
+
+
+def _build_trigram_index(aliases: Dict[str, str],
+                         exact_only: frozenset = frozenset()) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+    """Map each trigram to the aliases containing it, plus each alias's trigram count"""
+    postings = {}
+    sizes = {}
+    for alias in aliases:
+        if alias in exact_only:
+            continue
+        grams = _trigrams(alias)
+        sizes[alias] = len(grams)
+        for gram in grams:
+            postings.setdefault(gram, []).append(alias)
+    return postings, sizes
+
+
+def _words_covered(text: str, alias: str, generic_words: frozenset) -> bool:
+    """
+    Whether every non-generic word of text is a word of alias, or an
+    abbreviation of one ("univ", "inst"). Text made only of generic words
+    is never covered.
+    """
+    alias_words = alias.split()
+    distinctive = [word for word in text.split() if word not in generic_words]
+    return bool(distinctive) and all(
+        any(word == alias_word or (len(word) >= 3 and alias_word.startswith(word)) for alias_word in alias_words)
+        for word in distinctive
+    )
+
+
+def _closest_by_trigrams(index: Tuple[Dict[str, List[str]], Dict[str, int]], text: str,
+                         generic_words: frozenset, threshold: float) -> Optional[str]:
+    """
+    Alias sharing the most trigrams with text, if their Jaccard similarity
+    reaches threshold and every non-generic word of text is in the alias
+    """
+    postings, sizes = index
+    grams = _trigrams(text)
+    shared = Counter(alias for gram in grams for alias in postings.get(gram, ()))
+    best, best_score = None, threshold
+    for alias, count in shared.items():
+        score = count / (len(grams) + sizes[alias] - count)
+        if score >= best_score and _words_covered(text, alias, generic_words):
+            best, best_score = alias, score
+    return best
+
+
 class ProgramResearchTool:
     """
     MCP Tool for researching graduate program information.
@@ -47,6 +177,9 @@ class ProgramResearchTool:
     use to formulate a helpful response.
     """
     
+    # All state is class-level, so instances need no __dict__
+    __slots__ = ()
+    
     TOOL_NAME = "program_research"
     TOOL_DESCRIPTION = """
     Research information about graduate programs at universities.
@@ -307,6 +440,88 @@ class ProgramResearchTool:
         "phd cs": "Computer Science",
         "mscs": "Computer Science"
     }
+
+    # Alias tries, so free-form names like "mit cs phd" or "cs phd" resolve
+    # by their longest leading alias in one walk over the query. Aliases
+    # that also start other schools' names ("cal poly") only match exactly.
+    EXACT_SCHOOL_ALIASES = frozenset({"cal"})
+    _SCHOOL_TRIE = _build_alias_trie(SCHOOL_ALIASES, EXACT_SCHOOL_ALIASES)
+    _PROGRAM_TRIE = _build_alias_trie(PROGRAM_ALIASES)
+
+    # Words that may follow a school alias in a query: program, degree and
+    # department words, and the schools' campus cities. Anything else names
+    # another institution ("Berkeley College", "MIT-WPU"), which must come
+    # back not-found.
+    SCHOOL_TRAILING_WORDS = frozenset(
+        word
+        for name in [*PROGRAM_ALIASES, *(program.lower() for programs in PROGRAM_DATABASE.values() for program in programs)]
+        for word in name.split()
+    ) | frozenset({
+        "phd", "ms", "msc", "masters", "master", "meng", "ma", "mba", "program", "programs",
+        "department", "dept", "graduate", "grad", "admissions", "school", "of", "in", "for", "the", "at",
+        "scs", "csail", "seas", "engineering", "campus",
+        "cambridge", "palo", "alto", "pittsburgh", "atlanta"
+    })
+
+    # Last resort for school names no alias starts, e.g. "massachusetts
+    # institute" or "carnegie-mellon": the alias with the most similar
+    # character trigrams. Every non-generic word of the query must also be a
+    # word of the alias, so "university of georgia" or "massachusetts college
+    # of art" doesn't resolve to a known school that merely shares a word.
+    GENERIC_SCHOOL_WORDS = frozenset({"university", "institute", "technology", "college", "school", "of", "the", "at"})
+    SCHOOL_TRIGRAM_THRESHOLD = 0.6
+    _SCHOOL_TRIGRAMS = _build_trigram_index(SCHOOL_ALIASES, EXACT_SCHOOL_ALIASES)
+
+    # Misspelled school names ("stanfrod", "berkley") within a small edit
+    # distance of an alias. A near miss may just as well be another school
+    # ("stamford"), so it's only offered as a did-you-mean in the not-found
+    # response, never resolved. Short names are too easily one edit from
+    # another school ("mit" vs "mist"), so they're never fuzzy matched.
+    SCHOOL_FUZZY_MIN_LENGTH = 5
+    SCHOOL_FUZZY_LONG_LENGTH = 8
+
+    # Resolved names and suggestions are memoized, so a repeated free-form
+    # or misspelled name skips the trigram and edit-distance searches
+    NAME_CACHE_SIZE = 1024
+
+    # Schools listed in not-found responses
+    _KNOWN_SCHOOLS = tuple(PROGRAM_DATABASE)
+
+    # Every (school, program, info_type) response payload, formatted once
+    # from the static PROGRAM_DATABASE (as read-only views, so nothing can
+    # edit a cached payload in place), and _DB_INDEX mapping each lowercase
+    # (school, program) name or alias pair to its database names.
+    # Built on first use by _ensure_index().
+    _FORMATTED_CACHE: Optional[Dict[tuple, MappingProxyType]] = None
+    _DB_INDEX: Optional[Dict[tuple, tuple]] = None
+
+    @classmethod
+    def _ensure_index(cls) -> None:
+        """Format every program's payload for every info_type once"""
+        if cls._FORMATTED_CACHE is not None:
+            return
+
+        tool = cls()
+        formatted = {}
+        db_index = {}
+        for school, programs in cls.PROGRAM_DATABASE.items():
+            school_names = [school.lower()]
+            school_names += [alias for alias, name in cls.SCHOOL_ALIASES.items() if name == school]
+            for program, info in programs.items():
+                flat = cls._flatten(info)
+                for info_type in cls._PROJECTIONS:
+                    formatted[(school, program, info_type)] = MappingProxyType(
+                        tool._project(school, program, flat, info_type)
+                    )
+
+                program_names = [program.lower()]
+                program_names += [alias for alias, name in cls.PROGRAM_ALIASES.items() if name == program]
+                for school_name in school_names:
+                    for program_name in program_names:
+                        db_index[(school_name, program_name)] = (school, program)
+
+        cls._DB_INDEX = db_index
+        cls._FORMATTED_CACHE = formatted
     
     def __init__(self):
         pass
@@ -327,9 +542,22 @@ class ProgramResearchTool:
         if not program:
             return self._error("Missing required parameter: program")
         
-        # Normalize school and program names
-        school_normalized = self._normalize_school(school)
-        program_normalized = self._normalize_program(program)
+        # A database name or alias pair resolves in one lookup; anything
+        # else goes through the alias tries
+        self._ensure_index()
+        names = self._DB_INDEX.get((school.lower(), program.lower()))
+        if names is not None:
+            school_normalized, program_normalized = names
+        else:
+            school_normalized = self._normalize_school(school)
+            program_normalized = self._normalize_program(program)
+        
+        # Known program and info type: the payload was formatted up front.
+        # Copied into a plain dict, which callers may edit and json can
+        # serialize (a mappingproxy is neither).
+        cached = self._FORMATTED_CACHE.get((school_normalized, program_normalized, info_type))
+        if cached is not None:
+            return self._success(data=dict(cached))
         
         # Look up program info
         program_info = self._get_program_info(school_normalized, program_normalized)
@@ -338,33 +566,53 @@ class ProgramResearchTool:
             # Program not in our database - return helpful message
             return self._not_found(school, program)
         
-        # Filter by requested info type
-        if info_type == "all":
-            result = self._format_all_info(school_normalized, program_normalized, program_info)
-        elif info_type == "deadline":
-            result = self._format_deadline(school_normalized, program_normalized, program_info)
-        elif info_type == "requirements":
-            result = self._format_requirements(school_normalized, program_normalized, program_info)
-        elif info_type == "funding":
-            result = self._format_funding(school_normalized, program_normalized, program_info)
-        elif info_type == "ranking":
-            result = self._format_ranking(school_normalized, program_normalized, program_info)
-        elif info_type == "faculty":
-            result = self._format_faculty(school_normalized, program_normalized, program_info)
-        else:
-            return self._error(f"Unknown info_type: {info_type}")
-        
-        return self._success(data=result)
-    
-    def _normalize_school(self, school: str) -> str:
+        return self._error(f"Unknown info_type: {info_type}")
+
+    def execute_batch(self, params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Look up several programs in one call.
+
+        Each item holds the same parameters as execute(). Results are
+        returned in input order, and repeated names resolve through the
+        normalizer caches, so a batch costs one index lookup per item.
+        """
+        self._ensure_index()
+        execute = self.execute
+        return [execute(**params) for params in params_list]
+
+    @classmethod
+    @lru_cache(maxsize=NAME_CACHE_SIZE)
+    def _normalize_school(cls, school: str) -> str:
         """Normalize school name using aliases"""
-        lower = school.lower()
-        return self.SCHOOL_ALIASES.get(lower, school)
+        lower = _fold_name(school)
+        alias = cls.SCHOOL_ALIASES.get(lower) or _longest_alias(cls._SCHOOL_TRIE, lower, cls.SCHOOL_TRAILING_WORDS)
+        if alias:
+            return alias
+        closest = _closest_by_trigrams(
+            cls._SCHOOL_TRIGRAMS, lower, cls.GENERIC_SCHOOL_WORDS, cls.SCHOOL_TRIGRAM_THRESHOLD
+        )
+        if closest:
+            return cls.SCHOOL_ALIASES[closest]
+        return school
+    
+    @classmethod
+    @lru_cache(maxsize=NAME_CACHE_SIZE)
+    def _suggest_school(cls, school: str) -> Optional[str]:
+        """Known school a misspelled, unresolved school name is probably meant to be"""
+        if cls._normalize_school(school) in cls.PROGRAM_DATABASE:
+            return None
+        lower = _fold_name(school)
+        if len(lower) < cls.SCHOOL_FUZZY_MIN_LENGTH:
+            return None
+        # One edit allowed, two from SCHOOL_FUZZY_LONG_LENGTH characters
+        max_dist = 1 if len(lower) < cls.SCHOOL_FUZZY_LONG_LENGTH else 2
+        return _fuzzy_alias(cls._SCHOOL_TRIE, lower, max_dist)
     
-    def _normalize_program(self, program: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=NAME_CACHE_SIZE)
+    def _normalize_program(cls, program: str) -> str:
         """Normalize program name using aliases"""
-        lower = program.lower()
-        return self.PROGRAM_ALIASES.get(lower, program)
+        return _longest_alias(cls._PROGRAM_TRIE, _fold_name(program)) or program
     
     def _get_program_info(self, school: str, program: str) -> Optional[Dict]:
         """Look up program info from database"""
@@ -375,91 +623,86 @@ class ProgramResearchTool:
     
     def _not_found(self, school: str, program: str) -> Dict[str, Any]:
         """Return a helpful not-found response"""
-        return {
+        response = {
             "success": True,
             "found": False,
             "message": f"I don't have detailed information about {program} at {school} in my database.",
             "suggestion": "I can provide general guidance, or you can check the program's official website for accurate information.",
-            "known_schools": list(self.PROGRAM_DATABASE.keys())
-        }
-    
-    def _format_all_info(self, school: str, program: str, info: Dict) -> Dict:
-        """Format all available information"""
-        return {
-            "found": True,
-            "school": school,
-            "program": program,
-            "degree_types": info.get("degree_types", []),
-            "deadline": info.get("deadline"),
-            "deadline_date": info.get("deadline_date"),
-            "requirements": info.get("requirements", {}),
-            "funding": info.get("funding", {}),
-            "ranking": info.get("ranking", {}),
-            "faculty_areas": info.get("faculty_areas", []),
-            "website": info.get("website")
-        }
-    
-    def _format_deadline(self, school: str, program: str, info: Dict) -> Dict:
-        """Format deadline information"""
-        return {
-            "found": True,
-            "school": school,
-            "program": program,
-            "deadline": info.get("deadline"),
-            "deadline_date": info.get("deadline_date"),
-            "degree_types": info.get("degree_types", [])
+            "known_schools": list(self._KNOWN_SCHOOLS)
         }
+        did_you_mean = self._suggest_school(school)
+        if did_you_mean:
+            response["did_you_mean"] = did_you_mean
+        return response
     
-    def _format_requirements(self, school: str, program: str, info: Dict) -> Dict:
-        """Format requirements information"""
-        reqs = info.get("requirements", {})
-        return {
-            "found": True,
-            "school": school,
-            "program": program,
-            "gre_required": reqs.get("gre_required"),
-            "gre_recommended": reqs.get("gre_recommended"),
-            "toefl_minimum": reqs.get("toefl_minimum"),
-            "ielts_minimum": reqs.get("ielts_minimum"),
-            "gpa_minimum": reqs.get("gpa_minimum"),
-            "gpa_recommended": reqs.get("gpa_recommended"),
-            "letters_required": reqs.get("letters_required")
-        }
+    # info_type -> the fields its payload exposes, as (response key, key in
+    # the flattened record, default factory for a missing value or None)
+    _PROJECTIONS = {
+        "all": (
+            ("degree_types", "degree_types", list),
+            ("deadline", "deadline", None),
+            ("deadline_date", "deadline_date", None),
+            ("requirements", "requirements", dict),
+            ("funding", "funding", dict),
+            ("ranking", "ranking", dict),
+            ("faculty_areas", "faculty_areas", list),
+            ("website", "website", None),
+        ),
+        "deadline": (
+            ("deadline", "deadline", None),
+            ("deadline_date", "deadline_date", None),
+            ("degree_types", "degree_types", list),
+        ),
+        "requirements": (
+            ("gre_required", "gre_required", None),
+            ("gre_recommended", "gre_recommended", None),
+            ("toefl_minimum", "toefl_minimum", None),
+            ("ielts_minimum", "ielts_minimum", None),
+            ("gpa_minimum", "gpa_minimum", None),
+            ("gpa_recommended", "gpa_recommended", None),
+            ("letters_required", "letters_required", None),
+        ),
+        "funding": (
+            ("tuition_per_year", "tuition_per_year", None),
+            ("funding_available", "funding_available", None),
+            ("funding_types", "funding_types", list),
+            ("funding_coverage", "funding_coverage", None),
+            ("stipend_amount", "stipend_amount", None),
+        ),
+        "ranking": (
+            ("us_news_rank", "us_news", None),
+            ("csrankings_rank", "csrankings", None),
+        ),
+        "faculty": (
+            ("research_areas", "faculty_areas", list),
+            ("website", "website", None),
+        ),
+    }
     
-    def _format_funding(self, school: str, program: str, info: Dict) -> Dict:
-        """Format funding information"""
-        funding = info.get("funding", {})
-        return {
-            "found": True,
-            "school": school,
-            "program": program,
-            "tuition_per_year": funding.get("tuition_per_year"),
-            "funding_available": funding.get("funding_available"),
-            "funding_types": funding.get("funding_types", []),
-            "funding_coverage": funding.get("funding_coverage"),
-            "stipend_amount": funding.get("stipend_amount")
-        }
+    # Sections whose fields _flatten() hoists to the top level
+    _FLATTENED_SECTIONS = ("requirements", "funding", "ranking")
     
-    def _format_ranking(self, school: str, program: str, info: Dict) -> Dict:
-        """Format ranking information"""
-        ranking = info.get("ranking", {})
-        return {
-            "found": True,
-            "school": school,
-            "program": program,
-            "us_news_rank": ranking.get("us_news"),
-            "csrankings_rank": ranking.get("csrankings")
-        }
+    @classmethod
+    def _flatten(cls, info: Dict) -> Dict:
+        """
+        One-level view of a program's info: the top-level fields (sections
+        included as-is) plus every section's fields. Section field names
+        must not collide with each other or with top-level names.
+        """
+        flat = dict(info)
+        for section in cls._FLATTENED_SECTIONS:
+            flat.update(info.get(section, {}))
+        return flat
     
-    def _format_faculty(self, school: str, program: str, info: Dict) -> Dict:
-        """Format faculty/research areas information"""
-        return {
-            "found": True,
-            "school": school,
-            "program": program,
-            "research_areas": info.get("faculty_areas", []),
-            "website": info.get("website")
-        }
+    def _project(self, school: str, program: str, flat: Dict, info_type: str) -> Dict:
+        """Format a program's flattened info as the payload for info_type"""
+        result = {"found": True, "school": school, "program": program}
+        for response_key, key, default in self._PROJECTIONS[info_type]:
+            if key in flat:
+                result[response_key] = flat[key]
+            else:
+                result[response_key] = default() if default else None
+        return result
     
     def _success(self, message: str = None, data: Any = None) -> Dict[str, Any]:
         """Create a success response"""
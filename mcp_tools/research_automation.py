@@ -25,10 +25,16 @@ Tool Schema:
 }
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Callable
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import asyncio
 import os
 import json
+import threading
+import time
 from openai import OpenAI
 
 
@@ -89,14 +95,41 @@ class ResearchAutomationTool:
                     "type": "boolean",
                     "description": "Include program fit analysis in research",
                     "default": True
+                },
+                "force_refresh": {
+                    "type": "boolean",
+                    "description": "Research again even if recent research is cached (for research_program)",
+                    "default": False
                 }
             },
             "required": ["action"]
         }
     }
 
-    # Research data cache (in production, this would be a database)
-    RESEARCH_CACHE = {}
+    # Research results, least recently used evicted first; entries older
+    # than the TTL are researched again
+    RESEARCH_CACHE_SIZE = 1024
+    RESEARCH_CACHE_TTL = int(os.getenv("RESEARCH_TTL_SEC", "86400"))
+
+    # (school, program) -> research entry; see _cache_get/_cache_put. Shared
+    # by all instances, since the API builds a new tool per request.
+    _research_cache: OrderedDict = OrderedDict()
+    _cache_lock = threading.RLock()
+
+    # (school, program) -> Future of a lookup still running, so
+    # concurrent requests for one program share a single lookup
+    _inflight: Dict[Tuple[str, str], Future] = {}
+    _inflight_lock = threading.Lock()
+
+    # Seconds a fetched user profile is reused by check_fit; profile edits
+    # show up in fit analysis after at most this long
+    PROFILE_CACHE_TTL = 60
+
+    # Maximum programs researched at once by batch_research
+    RESEARCH_CONCURRENCY = int(os.getenv("RESEARCH_CONCURRENCY", "8"))
+
+    # Serializes application writes from concurrent research calls
+    _write_lock = threading.Lock()
 
     def __init__(self, db_manager, program_research_tool):
         """
@@ -109,15 +142,23 @@ class ResearchAutomationTool:
         self.db = db_manager
         self.program_research = program_research_tool
 
-        # Initialize OpenAI client for AI-powered research summaries
-        api_key = os.getenv('OPENROUTER_API_KEY') or os.getenv('OPENAI_API_KEY')
-        if api_key:
-            self.client = OpenAI(
-                api_key=api_key,
+        # (expiry time, profile) from the last profile read
+        self._profile_cache: Tuple[float, Optional[Dict]] = (0.0, None)
+
+        # OpenAI client for AI-powered research summaries, built on first
+        # use of self.client
+        self._api_key = os.getenv('OPENROUTER_API_KEY') or os.getenv('OPENAI_API_KEY')
+        self._client: Optional[OpenAI] = None
+
+    @property
+    def client(self) -> Optional[OpenAI]:
+        """OpenRouter client, created on first access; None without an API key"""
+        if self._client is None and self._api_key:
+            self._client = OpenAI(
+                api_key=self._api_key,
                 base_url="https://openrouter.ai/api/v1"
             )
-        else:
-            self.client = None
+        return self._client
 
     def execute(self, **params) -> Dict[str, Any]:
         """Execute the research automation tool."""
@@ -144,9 +185,26 @@ class ResearchAutomationTool:
         except Exception as e:
             return self._error(f"Error executing {action}: {str(e)}")
 
-    def _research_program(self, params: Dict) -> Dict[str, Any]:
+    async def execute_async(self, **params) -> Dict[str, Any]:
+        """
+        Run execute() in a worker thread, for callers on an event loop.
+
+        Research blocks on SQLite reads and writes (batch_research on many
+        of them), which would otherwise stall every other request on the loop.
+        """
+        return await asyncio.to_thread(self.execute, **params)
+
+    def _research_program(self, params: Dict,
+                          deferred_updates: Optional[List[Tuple[int, Optional[str], Optional[str]]]] = None,
+                          today: Optional[str] = None) -> Dict[str, Any]:
         """
         Research a specific program and gather comprehensive information.
+
+        When deferred_updates is given, application updates are appended to
+        it as (app_id, note_suffix, deadline) for the caller to write, not
+        written here.
+        Batches pass today's date stamp once in today; otherwise it is read
+        from the clock when notes are written.
         """
         app_id = params.get("app_id")
         auto_update = params.get("auto_update", True)
@@ -162,24 +220,21 @@ class ResearchAutomationTool:
         school = app.get("school_name")
         program = app.get("program_name")
 
-        # Research the program using ProgramResearchTool
-        research_result = self.program_research.execute(
-            school=school,
-            program=program,
-            info_type="all"
-        )
+        # Reuse fresh research unless a refresh was asked for
+        cached = None if params.get("force_refresh") else self._cache_get(school, program)
+        if cached:
+            research_data = cached["data"]
+        else:
+            # Research the program using ProgramResearchTool
+            research_result = self._lookup_program(school, program)
 
-        if not research_result.get("success"):
-            return self._error(f"Failed to research {school} - {program}")
+            if not research_result.get("success"):
+                return self._error(f"Failed to research {school} - {program}")
 
-        research_data = research_result.get("data", {})
+            research_data = research_result.get("data", {})
 
-        # Store in cache
-        cache_key = f"{school}_{program}"
-        self.RESEARCH_CACHE[cache_key] = {
-            "timestamp": datetime.now().isoformat(),
-            "data": research_data
-        }
+            # Store in cache
+            self._cache_put(school, program, research_data)
 
         # Auto-update application if requested
         updates_made = {}
@@ -190,13 +245,19 @@ class ResearchAutomationTool:
 
             # Add research summary to notes
             summary = self._generate_research_summary(research_data)
-            existing_notes = app.get("notes", "")
-            new_notes = f"{existing_notes}\n\n--- Auto-Research ({datetime.now().strftime('%Y-%m-%d')}) ---\n{summary}"
-            updates_made["notes"] = new_notes
-
-            # Apply updates
-            if updates_made:
-                self.db.update_application(app_id, updates_made)
+            today = today or datetime.now().strftime('%Y-%m-%d')
+            note_suffix = f"\n\n--- Auto-Research ({today}) ---\n{summary}"
+            updates_made["notes"] = note_suffix
+
+            # Apply updates: the database appends the notes and only fills
+            # the deadline if it is still empty, so no write is lost to a
+            # concurrent one
+            update = (app_id, note_suffix, updates_made.get("deadline"))
+            if deferred_updates is not None:
+                deferred_updates.append(update)
+            else:
+                with self._write_lock:
+                    self.db.append_notes_and_set_deadline(*update)
 
         return self._success(
             message=f"Researched {school} - {program}",
@@ -215,6 +276,7 @@ class ResearchAutomationTool:
         Research all programs in "researching" status.
         """
         auto_update = params.get("auto_update", True)
+        include_fit = params.get("include_fit_analysis", True)
 
         # Get all applications in researching status
         researching_apps = self.db.get_applications_by_status("researching")
@@ -225,25 +287,90 @@ class ResearchAutomationTool:
                 data={"researched": []}
             )
 
-        # Research each program
+        # Research the programs in parallel; each one waits on its lookup,
+        # so threads overlap those waits. Their application updates are
+        # collected and written together in one transaction.
+        pending_updates: List[Tuple[int, Optional[str], Optional[str]]] = []
+        today = datetime.now().strftime('%Y-%m-%d')
+        workers = max(1, min(self.RESEARCH_CONCURRENCY, len(researching_apps)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(
+                lambda app: self._research_one(app["id"], auto_update, pending_updates, today), researching_apps
+            ))
+
+        if pending_updates:
+            with self._write_lock:
+                self.db.append_notes_and_set_deadline_bulk(pending_updates)
+
+        # A failed program is reported, not allowed to abort the batch
         results = []
-        for app in researching_apps:
-            result = self._research_program({
-                "app_id": app["id"],
-                "auto_update": auto_update
-            })
-
+        failed = []
+        for app, result in zip(researching_apps, outcomes):
             if result.get("success"):
                 results.append(result.get("data"))
+            else:
+                failed.append({"app_id": app["id"], "error": result.get("error")})
+
+        # Score every program against the profile with one specialized scorer
+        profile = self._get_profile() if include_fit and results else None
+        if profile:
+            score_fit = self._make_fit_scorer(profile)
+            for data in results:
+                data["fit_analysis"] = score_fit(data["research"])
 
         return self._success(
             message=f"Researched {len(results)} programs",
             data={
                 "total_researched": len(results),
-                "results": results
+                "results": results,
+                "failed": failed
             }
         )
 
+    def batch_research_stream(self, auto_update: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Research all programs in "researching" status, yielding each result
+        as soon as it finishes.
+
+        Yields {"app_id", "success", "data" or "error"} in completion order,
+        so a caller can show the first programs while the rest are still
+        running. Unlike batch_research, each program's updates are written
+        as it completes, so stopping early keeps the work already done.
+        """
+        researching_apps = self.db.get_applications_by_status("researching")
+        if not researching_apps:
+            return
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        workers = max(1, min(self.RESEARCH_CONCURRENCY, len(researching_apps)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._research_one, app["id"], auto_update, None, today): app["id"]
+                for app in researching_apps
+            }
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    item = {"app_id": futures[future], "success": result.get("success", False)}
+                    if item["success"]:
+                        item["data"] = result.get("data")
+                    else:
+                        item["error"] = result.get("error")
+                    yield item
+            finally:
+                # Closing the stream early skips programs not yet started
+                for future in futures:
+                    future.cancel()
+
+    def _research_one(self, app_id: int, auto_update: bool,
+                      deferred_updates: Optional[List[Tuple[int, Optional[str], Optional[str]]]],
+                      today: str) -> Dict[str, Any]:
+        """Research one application for batch_research, catching its errors."""
+        try:
+            return self._research_program({"app_id": app_id, "auto_update": auto_update}, deferred_updates, today)
+        except Exception as e:
+            return self._error(f"Error researching application {app_id}: {str(e)}")
+
     def _get_summary(self, params: Dict) -> Dict[str, Any]:
         """
         Get a summary of research findings for all or specific programs.
@@ -256,8 +383,7 @@ class ResearchAutomationTool:
             if not app:
                 return self._error(f"Application {app_id} not found")
 
-            cache_key = f"{app['school_name']}_{app['program_name']}"
-            cached = self.RESEARCH_CACHE.get(cache_key)
+            cached = self._cache_get(app["school_name"], app["program_name"])
 
             if not cached:
                 return self._error(f"No research data found for {app['school_name']}. Run research_program first.")
@@ -274,9 +400,9 @@ class ResearchAutomationTool:
         else:
             # Get summary for all researched programs
             summaries = []
-            for key, cached in self.RESEARCH_CACHE.items():
+            for cached in self._cache_entries():
                 summaries.append({
-                    "program": key,
+                    "program": f"{cached['school']}_{cached['program']}",
                     "researched_at": cached["timestamp"],
                     "summary": self._generate_research_summary(cached["data"])
                 })
@@ -303,20 +429,19 @@ class ResearchAutomationTool:
             return self._error(f"Application {app_id} not found")
 
         # Get user profile
-        profile = self.db.get_user_profile()
+        profile = self._get_profile()
 
         # Get research data
-        cache_key = f"{app['school_name']}_{app['program_name']}"
-        cached = self.RESEARCH_CACHE.get(cache_key)
+        cached = self._cache_get(app["school_name"], app["program_name"])
 
-        if not cached:
+        if cached:
+            research_data = cached["data"]
+        else:
             # Research it first
             research_result = self._research_program({"app_id": app_id, "auto_update": False})
             if not research_result.get("success"):
                 return research_result
-            cached = self.RESEARCH_CACHE.get(cache_key)
-
-        research_data = cached["data"]
+            research_data = research_result["data"]["research"]
 
         # Analyze fit
         fit_analysis = self._analyze_fit(profile, research_data)
@@ -346,17 +471,16 @@ class ResearchAutomationTool:
             return self._error(f"Application {app_id} not found")
 
         # Get research data
-        cache_key = f"{app['school_name']}_{app['program_name']}"
-        cached = self.RESEARCH_CACHE.get(cache_key)
+        cached = self._cache_get(app["school_name"], app["program_name"])
 
-        if not cached:
+        if cached:
+            research_data = cached["data"]
+        else:
             # Research it first
             research_result = self._research_program({"app_id": app_id, "auto_update": False})
             if not research_result.get("success"):
                 return research_result
-            cached = self.RESEARCH_CACHE.get(cache_key)
-
-        research_data = cached["data"]
+            research_data = research_result["data"]["research"]
 
         # Populate fields
         updates = {}
@@ -371,7 +495,6 @@ class ResearchAutomationTool:
             funding = research_data.get("funding", {})
 
             notes_parts = [
-                app.get("notes", ""),
                 f"\n--- Program Details (Auto-populated {datetime.now().strftime('%Y-%m-%d')}) ---"
             ]
 
@@ -397,10 +520,12 @@ class ResearchAutomationTool:
             if research_data.get("research_areas"):
                 notes_parts.append(f"\nResearch Areas: {', '.join(research_data['research_areas'][:5])}")
 
-            updates["notes"] = "\n".join(notes_parts)
+            # Appended to the existing notes by the database
+            updates["notes"] = "\n" + "\n".join(notes_parts)
 
         if updates:
-            self.db.update_application(app_id, updates)
+            with self._write_lock:
+                self.db.append_notes_and_set_deadline(app_id, updates.get("notes"), updates.get("deadline"))
 
         return self._success(
             message=f"Auto-populated {len(updates)} fields for {app['school_name']}",
@@ -410,6 +535,88 @@ class ResearchAutomationTool:
             }
         )
 
+    def _lookup_program(self, school: str, program: str) -> Dict[str, Any]:
+        """
+        Look a program up with ProgramResearchTool.
+
+        A lookup already running for the same program is joined instead of
+        repeated, so parallel research never asks twice at once.
+        """
+        key = self._cache_key(school, program)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = self.program_research.execute(
+                school=school,
+                program=program,
+                info_type="all"
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _get_profile(self) -> Optional[Dict]:
+        """Return the user profile, reading the database at most once per PROFILE_CACHE_TTL"""
+        expires_at, profile = self._profile_cache
+        if time.monotonic() >= expires_at:
+            profile = self.db.get_user_profile()
+            self._profile_cache = (time.monotonic() + self.PROFILE_CACHE_TTL, profile)
+        return profile
+
+    @staticmethod
+    def _cache_key(school: str, program: str) -> Tuple[str, str]:
+        """Key research by name, ignoring case and surrounding whitespace"""
+        return ((school or "").strip().lower(), (program or "").strip().lower())
+
+    def _cache_get(self, school: str, program: str) -> Optional[Dict]:
+        """Return the cached research entry for a program, or None if missing or expired"""
+        key = self._cache_key(school, program)
+        with self._cache_lock:
+            entry = self._research_cache.get(key)
+            if entry is None:
+                return None
+            if entry["expires_at"] <= time.monotonic():
+                del self._research_cache[key]
+                return None
+            self._research_cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, school: str, program: str, research_data: Dict) -> None:
+        """Remember research for a program, evicting the least recently used"""
+        key = self._cache_key(school, program)
+        with self._cache_lock:
+            self._research_cache[key] = {
+                "school": school,
+                "program": program,
+                "timestamp": datetime.now().isoformat(),
+                "expires_at": time.monotonic() + self.RESEARCH_CACHE_TTL,
+                "data": research_data
+            }
+            self._research_cache.move_to_end(key)
+            if len(self._research_cache) > self.RESEARCH_CACHE_SIZE:
+                self._research_cache.popitem(last=False)
+
+    def _cache_entries(self) -> List[Dict]:
+        """Return the unexpired research entries, dropping expired ones"""
+        now = time.monotonic()
+        with self._cache_lock:
+            for key in [k for k, entry in self._research_cache.items() if entry["expires_at"] <= now]:
+                del self._research_cache[key]
+            return list(self._research_cache.values())
+
     def _generate_research_summary(self, research_data: Dict) -> str:
         """Generate a human-readable research summary."""
         if not research_data.get("found"):
@@ -448,93 +655,128 @@ class ResearchAutomationTool:
 
         return " | ".join(parts) if parts else "Details available"
 
+    # Score feedback helpers for _analyze_fit. Each returns (points, feedback
+    # line) and depends only on the scores compared, so a profile checked
+    # against many programs formats each line once. typed=True keeps 4 and
+    # 4.0 apart, since they print differently.
+
+    @staticmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _gpa_feedback(user_gpa: float, rec_gpa: float) -> Tuple[int, str]:
+        if user_gpa >= rec_gpa:
+            return 25, f"✓ Your GPA ({user_gpa}) meets/exceeds recommended ({rec_gpa})"
+        if user_gpa >= rec_gpa - 0.2:
+            return 15, f"~ Your GPA ({user_gpa}) is close to recommended ({rec_gpa})"
+        return 0, f"✗ Your GPA ({user_gpa}) is below recommended ({rec_gpa})"
+
+    @staticmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _gre_feedback(user_gre_q: int) -> Tuple[int, str]:
+        if user_gre_q >= 165:
+            return 25, f"✓ Strong GRE Quant score ({user_gre_q})"
+        if user_gre_q >= 160:
+            return 18, f"~ Good GRE Quant score ({user_gre_q})"
+        return 10, f"✗ GRE Quant score ({user_gre_q}) could be stronger"
+
+    @staticmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _toefl_feedback(user_toefl: int, min_toefl: int) -> Tuple[int, str]:
+        if user_toefl >= min_toefl:
+            return 20, f"✓ TOEFL score ({user_toefl}) meets minimum ({min_toefl})"
+        return 0, f"✗ TOEFL score ({user_toefl}) below minimum ({min_toefl})"
+
     def _analyze_fit(self, profile: Dict, research_data: Dict) -> Dict[str, Any]:
         """
         Analyze how well a program fits the user's profile.
 
         Returns a fit score and detailed analysis.
         """
-        fit_score = 0
-        max_score = 0
-        feedback = []
+        return self._make_fit_scorer(profile)(research_data)
 
-        reqs = research_data.get("requirements", {})
+    def _make_fit_scorer(self, profile: Dict) -> Callable[[Dict], Dict[str, Any]]:
+        """
+        Build a fit scorer specialized to one profile.
 
-        # Check GPA fit
+        The profile's fields are read once, and the GRE check, which needs
+        nothing from the program, is scored up front. The returned function
+        then only runs the checks that depend on each program's research data.
+        """
         user_gpa = profile.get("gpa")
-        rec_gpa = reqs.get("gpa_recommended")
-        if user_gpa and rec_gpa:
-            max_score += 25
-            if user_gpa >= rec_gpa:
-                fit_score += 25
-                feedback.append(f"✓ Your GPA ({user_gpa}) meets/exceeds recommended ({rec_gpa})")
-            elif user_gpa >= rec_gpa - 0.2:
-                fit_score += 15
-                feedback.append(f"~ Your GPA ({user_gpa}) is close to recommended ({rec_gpa})")
-            else:
-                feedback.append(f"✗ Your GPA ({user_gpa}) is below recommended ({rec_gpa})")
+        user_toefl = profile.get("toefl_score")
+        user_interests = (profile.get("research_interests") or "").lower()
 
         # Check GRE fit
         user_gre_q = profile.get("gre_quant")
-        if user_gre_q:
-            max_score += 25
-            if user_gre_q >= 165:
-                fit_score += 25
-                feedback.append(f"✓ Strong GRE Quant score ({user_gre_q})")
-            elif user_gre_q >= 160:
-                fit_score += 18
-                feedback.append(f"~ Good GRE Quant score ({user_gre_q})")
-            else:
-                fit_score += 10
-                feedback.append(f"✗ GRE Quant score ({user_gre_q}) could be stronger")
+        gre = self._gre_feedback(user_gre_q) if user_gre_q else None
 
-        # Check TOEFL fit (if international student)
-        user_toefl = profile.get("toefl_score")
-        min_toefl = reqs.get("toefl_minimum")
-        if user_toefl and min_toefl:
-            max_score += 20
-            if user_toefl >= min_toefl:
-                fit_score += 20
-                feedback.append(f"✓ TOEFL score ({user_toefl}) meets minimum ({min_toefl})")
-            else:
-                feedback.append(f"✗ TOEFL score ({user_toefl}) below minimum ({min_toefl})")
-
-        # Research interests match
-        user_interests = profile.get("research_interests", "").lower()
-        prog_areas = research_data.get("research_areas", [])
-        if user_interests and prog_areas:
-            max_score += 30
-            matches = sum(1 for area in prog_areas if area.lower() in user_interests or user_interests in area.lower())
-            if matches > 0:
-                match_score = min(30, matches * 10)
-                fit_score += match_score
-                feedback.append(f"✓ Research interests align ({matches} matching areas)")
-            else:
-                feedback.append("~ Research interest alignment unclear")
+        def score(research_data: Dict) -> Dict[str, Any]:
+            fit_score = 0
+            max_score = 0
+            feedback = []
 
-        # Calculate percentage
-        fit_percentage = int((fit_score / max_score * 100)) if max_score > 0 else 0
+            reqs = research_data.get("requirements", {})
 
-        # Determine tier
-        if fit_percentage >= 80:
-            tier = "safety"
-            tier_desc = "Safety school - strong fit!"
-        elif fit_percentage >= 60:
-            tier = "match"
-            tier_desc = "Match school - good fit"
-        else:
-            tier = "reach"
-            tier_desc = "Reach school - competitive"
-
-        return {
-            "fit_score": fit_score,
-            "max_score": max_score,
-            "fit_percentage": fit_percentage,
-            "tier": tier,
-            "tier_description": tier_desc,
-            "feedback": feedback,
-            "recommendation": self._get_fit_recommendation(fit_percentage)
-        }
+            # Check GPA fit
+            rec_gpa = reqs.get("gpa_recommended")
+            if user_gpa and rec_gpa:
+                max_score += 25
+                points, line = self._gpa_feedback(user_gpa, rec_gpa)
+                fit_score += points
+                feedback.append(line)
+
+            if gre:
+                max_score += 25
+                fit_score += gre[0]
+                feedback.append(gre[1])
+
+            # Check TOEFL fit (if international student)
+            min_toefl = reqs.get("toefl_minimum")
+            if user_toefl and min_toefl:
+                max_score += 20
+                points, line = self._toefl_feedback(user_toefl, min_toefl)
+                fit_score += points
+                feedback.append(line)
+
+            # Research interests match
+            prog_areas = research_data.get("research_areas", [])
+            if user_interests and prog_areas:
+                max_score += 30
+                matches = sum(
+                    1 for area in map(str.lower, prog_areas)
+                    if area in user_interests or user_interests in area
+                )
+                if matches > 0:
+                    match_score = min(30, matches * 10)
+                    fit_score += match_score
+                    feedback.append(f"✓ Research interests align ({matches} matching areas)")
+                else:
+                    feedback.append("~ Research interest alignment unclear")
+
+            # Calculate percentage
+            fit_percentage = int((fit_score / max_score * 100)) if max_score > 0 else 0
+
+            # Determine tier
+            if fit_percentage >= 80:
+                tier = "safety"
+                tier_desc = "Safety school - strong fit!"
+            elif fit_percentage >= 60:
+                tier = "match"
+                tier_desc = "Match school - good fit"
+            else:
+                tier = "reach"
+                tier_desc = "Reach school - competitive"
+
+            return {
+                "fit_score": fit_score,
+                "max_score": max_score,
+                "fit_percentage": fit_percentage,
+                "tier": tier,
+                "tier_description": tier_desc,
+                "feedback": feedback,
+                "recommendation": self._get_fit_recommendation(fit_percentage)
+            }
+
+        return score
 
     def _get_fit_recommendation(self, fit_percentage: int) -> str:
         """Get a recommendation based on fit percentage."""
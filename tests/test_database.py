@@ -0,0 +1,31 @@
+"""
+Tests for the research write path of the database manager
+"""
+
+import pytest
+
+from backend.database import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(db_path=str(tmp_path / "gradtrack.db"))
+    manager.initialize_database()
+    return manager
+
+
+@pytest.mark.parametrize("deadline", [None, ""])
+def test_missing_deadline_is_filled(db, deadline):
+    app_id = db.create_application("Stanford", "Computer Science", "PhD", deadline=deadline)
+    assert db.append_notes_and_set_deadline(app_id, "\nresearched", "2026-12-01")
+    app = db.get_application(app_id)
+    assert app["deadline"] == "2026-12-01"
+    assert app["notes"] == "\nresearched"
+
+
+def test_existing_deadline_is_kept(db):
+    app_id = db.create_application("MIT", "EECS", "PhD", deadline="2026-12-15", notes="first")
+    assert db.append_notes_and_set_deadline(app_id, " second", "2026-12-01")
+    app = db.get_application(app_id)
+    assert app["deadline"] == "2026-12-15"
+    assert app["notes"] == "first second"
@@ -0,0 +1,61 @@
+"""
+Regression tests for school name resolution in the program research tool
+"""
+
+import pytest
+
+from mcp_tools.program_research import ProgramResearchTool
+
+
+@pytest.fixture
+def tool():
+    return ProgramResearchTool()
+
+
+@pytest.mark.parametrize("school", [
+    "University of Massachusetts Amherst",
+    "University of Massachusetts",
+    "Massachusetts College of Art",
+    "University of Georgia",
+    "Georgia College",
+    "Berkeley College",
+    "mit-wpu",
+    "university",
+])
+def test_other_schools_are_not_found(tool, school):
+    result = tool.execute(school=school, program="Computer Science")
+    assert result["success"]
+    assert result["found"] is False
+
+
+@pytest.mark.parametrize("school, expected", [
+    ("MIT", "MIT"),
+    ("stanford university", "Stanford"),
+    ("massachusetts institute", "MIT"),
+    ("carnegie-mellon", "Carnegie Mellon"),
+    ("Georgia Institute of Tech", "Georgia Tech"),
+    ("MIT csail", "MIT"),
+    ("uc berkeley eecs", "UC Berkeley"),
+])
+def test_known_schools_resolve(tool, school, expected):
+    result = tool.execute(school=school, program="Computer Science")
+    assert result["success"]
+    assert result["data"]["found"] is True
+    assert result["data"]["school"] == expected
+
+
+@pytest.mark.parametrize("school, expected", [
+    ("Stamford", "Stanford"),
+    ("Stanfrod University", "Stanford"),
+    ("Berkley", "UC Berkeley"),
+])
+def test_misspelled_schools_are_only_suggested(tool, school, expected):
+    result = tool.execute(school=school, program="Computer Science")
+    assert result["found"] is False
+    assert result["did_you_mean"] == expected
+
+
+def test_unknown_program_at_known_school_has_no_suggestion(tool):
+    result = tool.execute(school="Stanford", program="Underwater Basket Weaving")
+    assert result["found"] is False
+    assert "did_you_mean" not in result